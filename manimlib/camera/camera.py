@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 import itertools as it
 import math
 
@@ -188,6 +189,10 @@ class Camera(object):
         # without multisampling, for 3d scenes one might want
         # to set samples to be greater than 0.
         "samples": 0,
+        # If set to 2 or more, frames written to file are read back from the
+        # gpu through this many pixel buffers used in rotation, so that copying
+        # one frame to host memory overlaps with drawing the next ones
+        "n_readback_buffers": 0,
     }
 
     def __init__(self, ctx: moderngl.Context | None = None, **kwargs):
@@ -200,12 +205,19 @@ class Camera(object):
         self.init_context(ctx)
         self.init_shaders()
         self.init_textures()
+        self.init_readback_buffers()
         self.init_light_source()
         self.refresh_perspective_uniforms()
         # A cached map from mobjects to their associated list of render groups
         # so that these render groups are not regenerated unnecessarily for static
         # mobjects
         self.mob_to_render_groups = {}
+        # Render groups for changing mobjects, keyed by the mobject and the
+        # shader wrapper they draw, whose buffers get rewritten each frame
+        # rather than being reallocated
+        self.render_group_pool: dict[tuple[int, int], dict[str]] = {}
+        # Counts calls to clear, each of which starts a new frame
+        self.n_frames: int = 0
 
     def init_frame(self) -> None:
         self.frame = CameraFrame(**self.frame_config)
@@ -261,26 +273,109 @@ class Camera(object):
         )
 
     def clear(self) -> None:
+        # A frame may be drawn in several captures, so pooled render
+        # groups are only released once the whole frame is done
+        self.release_stale_pooled_render_groups()
+        self.n_frames += 1
         self.fbo.clear(*self.background_rgba)
         self.fbo_msaa.clear(*self.background_rgba)
 
     def reset_pixel_shape(self, new_width: int, new_height: int) -> None:
+        # Frames still in flight are read at the old size, and kept
+        # to be returned ahead of any frames queued after this
+        completed_readbacks = self.flush_fbo_readbacks()
         self.pixel_width = new_width
         self.pixel_height = new_height
         self.refresh_perspective_uniforms()
+        self.release_readback_buffers()
+        self.init_readback_buffers()
+        self.completed_readbacks.extend(completed_readbacks)
 
-    def get_raw_fbo_data(self, dtype: str = 'f1') -> bytes:
+    def blit_msaa_fbo(self) -> None:
         # Copy blocks from the fbo_msaa to the drawn fbo using Blit
         pw, ph = (self.pixel_width, self.pixel_height)
         gl.glBindFramebuffer(gl.GL_READ_FRAMEBUFFER, self.fbo_msaa.glo)
         gl.glBindFramebuffer(gl.GL_DRAW_FRAMEBUFFER, self.fbo.glo)
         gl.glBlitFramebuffer(0, 0, pw, ph, 0, 0, pw, ph, gl.GL_COLOR_BUFFER_BIT, gl.GL_LINEAR)
+
+    def get_raw_fbo_data(self, dtype: str = 'f1') -> bytes:
+        self.blit_msaa_fbo()
         return self.fbo.read(
             viewport=self.fbo.viewport,
             components=self.n_channels,
             dtype=dtype,
         )
 
+    # Asynchronous readback through pixel buffers
+    def init_readback_buffers(self) -> None:
+        self.free_readback_buffers: deque[moderngl.Buffer] = deque()
+        self.pending_readbacks: deque[moderngl.Buffer] = deque()
+        # Frames already read back, but not yet returned
+        self.completed_readbacks: deque[bytes] = deque()
+        if not self.uses_async_readback():
+            return
+        pw, ph = self.get_pixel_shape()
+        for _ in range(self.n_readback_buffers):
+            self.free_readback_buffers.append(
+                self.ctx.buffer(reserve=pw * ph * self.n_channels)
+            )
+
+    def release_readback_buffers(self) -> None:
+        for buff in it.chain(self.free_readback_buffers, self.pending_readbacks):
+            buff.release()
+        self.free_readback_buffers.clear()
+        self.pending_readbacks.clear()
+
+    def uses_async_readback(self) -> bool:
+        return self.n_readback_buffers >= 2
+
+    def queue_fbo_readback(self) -> bytes | None:
+        """
+        Starts copying the current frame into the next free pixel buffer
+        without waiting on it.  Once all buffers are in flight, this returns
+        the bytes of the oldest queued frame, so frames come out in order,
+        n_readback_buffers - 1 calls late.  Otherwise returns None.
+        """
+        result = None
+        if not self.free_readback_buffers:
+            result = self.read_oldest_readback()
+        if self.completed_readbacks:
+            if result is not None:
+                self.completed_readbacks.append(result)
+            result = self.completed_readbacks.popleft()
+        buff = self.free_readback_buffers.popleft()
+        self.blit_msaa_fbo()
+        self.fbo.read_into(
+            buff,
+            viewport=self.fbo.viewport,
+            components=self.n_channels,
+            dtype='f1',
+        )
+        self.pending_readbacks.append(buff)
+        return result
+
+    def read_oldest_readback(self) -> bytes:
+        buff = self.pending_readbacks.popleft()
+        pw, ph = self.get_pixel_shape()
+        # Only blocks if the gpu has not yet finished this transfer
+        result = buff.read(size=pw * ph * self.n_channels)
+        self.free_readback_buffers.append(buff)
+        return result
+
+    def flush_fbo_readbacks(self) -> list[bytes]:
+        """
+        Returns the bytes of all frames still queued, in order
+        """
+        result = [
+            *self.completed_readbacks,
+            *(
+                self.read_oldest_readback()
+                for _ in range(len(self.pending_readbacks))
+            )
+        ]
+        self.completed_readbacks.clear()
+        return result
+
     def get_image(self) -> Image.Image:
         return Image.frombytes(
             'RGBA',
@@ -363,13 +458,19 @@ class Camera(object):
         shader_program = render_group["prog"]
         self.set_shader_uniforms(shader_program, shader_wrapper)
         self.set_ctx_depth_test(shader_wrapper.depth_test)
-        render_group["vao"].render(int(shader_wrapper.render_primitive))
+        render_group["vao"].render(
+            int(shader_wrapper.render_primitive),
+            vertices=render_group["n_verts"],
+        )
         if render_group["single_use"]:
             self.release_render_group(render_group)
 
     def get_render_group_list(self, mobject: Mobject) -> Iterable[dict[str]]:
         if mobject.is_changing():
-            return self.generate_render_group_list(mobject)
+            return [
+                self.get_pooled_render_group(mobject, sw)
+                for sw in mobject.get_shader_wrapper_list()
+            ]
 
         # Otherwise, cache result for later use
         key = id(mobject)
@@ -390,22 +491,15 @@ class Camera(object):
     ) -> dict[str]:
         # Data buffers
         vbo = self.ctx.buffer(shader_wrapper.vert_data.tobytes())
-        if shader_wrapper.vert_indices is None:
+        vert_index_data = self.get_vert_index_data(shader_wrapper)
+        if vert_index_data is None:
             ibo = None
         else:
-            vert_index_data = shader_wrapper.vert_indices.astype('i4').tobytes()
-            if vert_index_data:
-                ibo = self.ctx.buffer(vert_index_data)
-            else:
-                ibo = None
+            ibo = self.ctx.buffer(vert_index_data)
 
         # Program and vertex array
         shader_program, vert_format = self.get_shader_program(shader_wrapper)
-        vao = self.ctx.vertex_array(
-            program=shader_program,
-            content=[(vbo, vert_format, *shader_wrapper.vert_attributes)],
-            index_buffer=ibo,
-        )
+        vao = self.get_vertex_array(shader_program, vert_format, shader_wrapper, vbo, ibo)
         return {
             "vbo": vbo,
             "ibo": ibo,
@@ -413,8 +507,103 @@ class Camera(object):
             "prog": shader_program,
             "shader_wrapper": shader_wrapper,
             "single_use": single_use,
+            "n_verts": -1,
         }
 
+    def get_vert_index_data(self, shader_wrapper: ShaderWrapper) -> bytes | None:
+        if shader_wrapper.vert_indices is None:
+            return None
+        vert_index_data = shader_wrapper.vert_indices.astype('i4').tobytes()
+        return vert_index_data or None
+
+    def get_vertex_array(
+        self,
+        shader_program: moderngl.Program,
+        vert_format: str,
+        shader_wrapper: ShaderWrapper,
+        vbo: moderngl.Buffer,
+        ibo: moderngl.Buffer | None
+    ) -> moderngl.VertexArray:
+        return self.ctx.vertex_array(
+            program=shader_program,
+            content=[(vbo, vert_format, *shader_wrapper.vert_attributes)],
+            index_buffer=ibo,
+        )
+
+    def get_pooled_render_group(
+        self,
+        mobject: Mobject,
+        shader_wrapper: ShaderWrapper
+    ) -> dict[str]:
+        """
+        Render groups for changing mobjects are kept around between frames,
+        with new data written into their existing buffers, so that the
+        buffers and vertex arrays needn't be regenerated every frame.
+        """
+        key = (id(mobject), id(shader_wrapper))
+        vert_data = shader_wrapper.vert_data.tobytes()
+        vert_index_data = self.get_vert_index_data(shader_wrapper)
+        shader_program, vert_format = self.get_shader_program(shader_wrapper)
+
+        render_group = self.render_group_pool.get(key)
+        if render_group is not None and any((
+            render_group["prog"] is not shader_program,
+            render_group["vert_format"] != vert_format,
+            render_group["vert_attributes"] != shader_wrapper.vert_attributes,
+            (render_group["ibo"] is None) != (vert_index_data is None),
+        )):
+            # Buffers can be reused, but not with this vertex array
+            self.release_render_group(render_group)
+            render_group = None
+
+        if render_group is None:
+            vbo = self.ctx.buffer(vert_data)
+            ibo = None if vert_index_data is None else self.ctx.buffer(vert_index_data)
+            render_group = {
+                "vbo": vbo,
+                "ibo": ibo,
+                "vao": self.get_vertex_array(
+                    shader_program, vert_format, shader_wrapper, vbo, ibo
+                ),
+                "prog": shader_program,
+                "vert_format": vert_format,
+                "vert_attributes": shader_wrapper.vert_attributes,
+                "single_use": False,
+            }
+            self.render_group_pool[key] = render_group
+        else:
+            self.write_to_buffer(render_group["vbo"], vert_data)
+            if vert_index_data is not None:
+                self.write_to_buffer(render_group["ibo"], vert_index_data)
+
+        if vert_index_data is None:
+            render_group["n_verts"] = len(shader_wrapper.vert_data)
+        else:
+            render_group["n_verts"] = len(shader_wrapper.vert_indices)
+        render_group["shader_wrapper"] = shader_wrapper
+        render_group["last_frame"] = self.n_frames
+        return render_group
+
+    def write_to_buffer(self, buffer: moderngl.Buffer, data: bytes) -> None:
+        # Orphaning lets the driver hand back fresh storage rather
+        # than waiting on draws still reading from the old contents
+        if len(data) > buffer.size:
+            buffer.orphan(max(len(data), 2 * buffer.size))
+        else:
+            buffer.orphan()
+        buffer.write(data)
+
+    def release_stale_pooled_render_groups(self) -> None:
+        # Anything not drawn in the current frame has either stopped
+        # changing or left the scene
+        stale_keys = [
+            key
+            for key, render_group in self.render_group_pool.items()
+            if render_group["last_frame"] != self.n_frames
+        ]
+        for key in stale_keys:
+            self.release_render_group(self.render_group_pool.pop(key))
+
     def release_render_group(self, render_group: dict[str]) -> None:
         for key in ["vbo", "ibo", "vao"]:
             if render_group[key] is not None:
@@ -154,6 +154,24 @@ def parse_cli():
             action="store_true",
             help="Show progress bar for each animation",
         )
+        parser.add_argument(
+            "--workers",
+            help="Number of processes to split the animations of a scene "
+                 "across when writing it to a movie file",
+        )
+        parser.add_argument(
+            "--disable_cache",
+            action="store_true",
+            help="Re-render every animation, rather than reusing partial "
+                 "movie files from earlier renders, and always do a dry run "
+                 "to count frames",
+        )
+        parser.add_argument(
+            "--skip_dry_run",
+            action="store_true",
+            help="Don't run through a changed scene first to count its frames, "
+                 "but estimate them from the last time it was rendered",
+        )
         parser.add_argument(
             "--video_dir",
             help="Directory to write video",
@@ -331,6 +349,7 @@ def get_configuration(args):
     check_temporary_storage(custom_config)
 
     write_file = any([args.write_file, args.open, args.finder])
+    n_workers = int(args.workers) if args.workers else 1
     if args.transparent:
         file_ext = ".mov"
     elif args.gif:
@@ -350,7 +369,11 @@ def get_configuration(args):
 
     file_writer_config = {
         "write_to_movie": not args.skip_animations and write_file,
-        "break_into_partial_movies": custom_config["break_into_partial_movies"],
+        # Parallel renders are stitched together from partial movies
+        "break_into_partial_movies": custom_config["break_into_partial_movies"] or n_workers > 1,
+        "frame_queue_size": custom_config["frame_queue_size"],
+        "cache_partial_movies": not args.disable_cache,
+        "partial_movie_cache_max_mb": custom_config["partial_movie_cache_max_mb"],
         "save_last_frame": args.skip_animations and write_file,
         "save_pngs": args.save_pngs,
         # If -t is passed in (for transparent), this will be RGBA
@@ -383,6 +406,9 @@ def get_configuration(args):
         "presenter_mode": args.presenter_mode,
         "leave_progress_bars": args.leave_progress_bars,
         "show_animation_progress": args.show_animation_progress,
+        "n_workers": n_workers,
+        "skip_dry_run": args.skip_dry_run,
+        "cache_timelines": not args.disable_cache,
     }
 
     # Camera configuration
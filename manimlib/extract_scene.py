@@ -6,6 +6,8 @@ from manimlib.config import get_custom_config
 from manimlib.logger import log
 from manimlib.scene.interactive_scene import InteractiveScene
 from manimlib.scene.scene import Scene
+from manimlib.scene.scene_file_writer import is_timeline_current
+from manimlib.scene.scene_file_writer import load_scene_timeline
 
 
 class BlankScene(InteractiveScene):
@@ -67,11 +69,12 @@ def get_scene_config(config):
             "show_animation_progress",
             "preview",
             "presenter_mode",
+            "n_workers",
         ]
     ])
 
 
-def compute_total_frames(scene_class, scene_config):
+def run_pre_scene(scene_class, scene_config):
     """
     When a scene is being written to file, a copy of the scene is run with
     skip_animations set to true so as to count how many frames it will require.
@@ -85,25 +88,66 @@ def compute_total_frames(scene_class, scene_config):
     pre_config["file_writer_config"]["save_last_frame"] = True
     pre_config["file_writer_config"]["quiet"] = True
     pre_config["skip_animations"] = True
+    pre_config["n_workers"] = 1
     pre_scene = scene_class(**pre_config)
     pre_scene.run()
-    total_time = pre_scene.time - pre_scene.skip_time
-    return int(total_time * scene_config["camera_config"]["fps"])
+    return pre_scene
+
+
+def compute_total_frames(timeline, scene_config):
+    return int(timeline["duration"] * scene_config["camera_config"]["fps"])
+
+
+def get_scene_timeline(scene_class, scene_config, config):
+    """
+    The timeline saved by the last render or dry run of this scene is reused
+    when neither the scene's file nor the other modules it imported from
+    outside of manimlib have changed since.  Otherwise a dry run is done,
+    unless skip_dry_run is set, in which case a stale timeline still serves
+    as an estimate.
+    """
+    fw_config = scene_config["file_writer_config"]
+    input_file_path = fw_config["input_file_path"]
+    timeline = None
+    if config["cache_timelines"] and input_file_path:
+        timeline = load_scene_timeline(input_file_path, scene_class.__name__)
+    if timeline is not None and is_timeline_current(
+        timeline, input_file_path,
+        scene_config["start_at_animation_number"],
+        scene_config["end_at_animation_number"],
+    ):
+        return timeline
+    if config["skip_dry_run"]:
+        return timeline
+    return run_pre_scene(scene_class, scene_config).get_timeline()
+
+
+def init_scene(scene_class, scene_config, config, count_frames=True):
+    fw_config = scene_config["file_writer_config"]
+    parallel = scene_config["n_workers"] > 1
+    if fw_config["write_to_movie"] and (count_frames or parallel):
+        timeline = get_scene_timeline(scene_class, scene_config, config)
+        if timeline is not None:
+            fw_config["total_frames"] = compute_total_frames(timeline, scene_config)
+            if parallel:
+                # Workers are each assigned a range of this many plays
+                return scene_class(**scene_config, num_plays_hint=timeline["num_plays"])
+    return scene_class(**scene_config)
 
 
 def get_scenes_to_render(scene_classes, scene_config, config):
     if config["write_all"]:
-        return [sc(**scene_config) for sc in scene_classes]
+        return [
+            init_scene(sc, scene_config, config, count_frames=False)
+            for sc in scene_classes
+        ]
 
     result = []
     for scene_name in config["scene_names"]:
         found = False
         for scene_class in scene_classes:
             if scene_class.__name__ == scene_name:
-                fw_config = scene_config["file_writer_config"]
-                if fw_config["write_to_movie"]:
-                    fw_config["total_frames"] = compute_total_frames(scene_class, scene_config)
-                scene = scene_class(**scene_config)
+                scene = init_scene(scene_class, scene_config, config)
                 result.append(scene)
                 found = True
                 break
@@ -119,10 +163,7 @@ def get_scenes_to_render(scene_classes, scene_config, config):
     else:
         scene_classes = prompt_user_for_choice(scene_classes)
     for scene_class in scene_classes:
-        fw_config = scene_config["file_writer_config"]
-        if fw_config["write_to_movie"]:
-            fw_config["total_frames"] = compute_total_frames(scene_class, scene_config)
-        scene = scene_class(**scene_config)
+        scene = init_scene(scene_class, scene_config, config)
         result.append(scene)
     return result
 
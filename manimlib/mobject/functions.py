@@ -7,6 +7,7 @@ from manimlib.constants import FRAME_X_RADIUS, FRAME_Y_RADIUS
 from manimlib.constants import YELLOW
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.config_ops import digest_config
+from manimlib.utils.space_ops import get_dists_to_segments
 
 from typing import TYPE_CHECKING
 
@@ -21,6 +22,15 @@ class ParametricCurve(VMobject):
         # TODO, automatically figure out discontinuities
         "discontinuities": [],
         "use_smoothing": True,
+        # If True, t_func is first called on an array of t values, and should
+        # return an array of shape (len(t), 3).  If that call fails, it falls
+        # back to calling t_func once per sample
+        "batch_t_func": False,
+        # If set, samples are added where the curve strays further than this
+        # from the line between neighboring samples, and dropped where the
+        # remaining samples would still be within this distance of the curve
+        "adaptive_tolerance": None,
+        "max_refinements": 8,
     }
 
     def __init__(
@@ -44,6 +54,61 @@ class ParametricCurve(VMobject):
     def get_point_from_function(self, t: float) -> np.ndarray:
         return self.t_func(t)
 
+    def get_points_from_function(self, t_values: np.ndarray) -> np.ndarray:
+        if self.batch_t_func:
+            try:
+                points = np.array(self.t_func(t_values), dtype=float)
+            except (TypeError, ValueError):
+                points = None
+            if points is not None and points.shape == (len(t_values), self.dim):
+                return points
+        return np.array([self.t_func(t) for t in t_values])
+
+    def get_adaptive_samples(
+        self,
+        t_values: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Starting from t_values, repeatedly samples the middle of each interval
+        where the curve strays more than adaptive_tolerance from the segment
+        between its end points, then drops the samples which aren't needed to
+        keep all the others within that tolerance.
+        """
+        tol = self.adaptive_tolerance
+        points = self.get_points_from_function(t_values)
+        # Only intervals which were just split need to be checked again
+        to_check = np.arange(len(t_values) - 1)
+        for _ in range(self.max_refinements):
+            if len(to_check) == 0:
+                break
+            mid_t_values = (t_values[to_check] + t_values[to_check + 1]) / 2
+            mid_points = self.get_points_from_function(mid_t_values)
+            errors = get_dists_to_segments(
+                mid_points, points[to_check], points[to_check + 1]
+            )
+            to_split = errors > tol
+            to_check = to_check[to_split]
+            t_values = np.insert(t_values, to_check + 1, mid_t_values[to_split])
+            points = np.insert(points, to_check + 1, mid_points[to_split], axis=0)
+            # Indices of the new samples, and of the intervals before them
+            new_indices = to_check + 1 + np.arange(len(to_check))
+            to_check = np.sort(np.hstack([new_indices - 1, new_indices]))
+
+        # Simplify with the Ramer-Douglas-Peucker algorithm
+        keep = np.zeros(len(points), dtype=bool)
+        keep[[0, -1]] = True
+        ranges = [(0, len(points) - 1)]
+        while ranges:
+            i1, i2 = ranges.pop()
+            if i2 - i1 < 2:
+                continue
+            dists = get_dists_to_segments(points[i1 + 1:i2], points[i1], points[i2])
+            if dists.max() > tol:
+                index = i1 + 1 + np.argmax(dists)
+                keep[index] = True
+                ranges.extend([(i1, index), (index, i2)])
+        return t_values[keep], points[keep]
+
     def init_points(self):
         t_min, t_max, step = self.t_range
 
@@ -52,8 +117,11 @@ class ParametricCurve(VMobject):
         boundary_times = [t_min, t_max, *(jumps - self.epsilon), *(jumps + self.epsilon)]
         boundary_times.sort()
         for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2]):
-            t_range = [*np.arange(t1, t2, step), t2]
-            points = np.array([self.t_func(t) for t in t_range])
+            t_range = np.array([*np.arange(t1, t2, step), t2])
+            if self.adaptive_tolerance is not None:
+                t_range, points = self.get_adaptive_samples(t_range)
+            else:
+                points = self.get_points_from_function(t_range)
             self.start_new_path(points[0])
             self.add_points_as_corners(points[1:])
         if self.use_smoothing:
@@ -95,6 +163,8 @@ class FunctionGraph(ParametricCurve):
             self.x_range[:len(x_range)] = x_range
 
         def parametric_function(t):
+            if isinstance(t, np.ndarray):
+                return np.array([t, function(t), 0 * t]).T
             return [t, function(t), 0]
 
         super().__init__(parametric_function, self.x_range, **kwargs)
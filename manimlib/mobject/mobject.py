@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import copy
 from functools import wraps
+import hashlib
 import itertools as it
 import os
 import pickle
@@ -25,11 +26,13 @@ from manimlib.event_handler.event_type import EventType
 from manimlib.logger import log
 from manimlib.shader_wrapper import get_colormap_code
 from manimlib.shader_wrapper import ShaderWrapper
+from manimlib.utils.array_io import is_array_file
 from manimlib.utils.color import color_gradient
 from manimlib.utils.color import color_to_rgb
 from manimlib.utils.color import get_colormap_list
 from manimlib.utils.color import rgb_to_hex
 from manimlib.utils.config_ops import digest_config
+from manimlib.utils.copy_on_write import CopyOnWriteDict
 from manimlib.utils.iterables import batch_by_property
 from manimlib.utils.iterables import list_update
 from manimlib.utils.iterables import listify
@@ -48,7 +51,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from colour import Color
-    from typing import Callable, Iterable, Sequence, Union
+    from typing import Callable, Hashable, Iterable, Sequence, Union
 
     import numpy.typing as npt
 
@@ -62,6 +65,10 @@ class Mobject(object):
     """
     Mathematical Object
     """
+    # Attributes holding shader data, which is refilled
+    # from self.data each time it's needed
+    shader_buffer_attrs: tuple[str, ...] = ("shader_data",)
+
     CONFIG = {
         "color": WHITE,
         "opacity": 1,
@@ -92,6 +99,13 @@ class Mobject(object):
         self.submobjects: list[Mobject] = []
         self.parents: list[Mobject] = []
         self.family: list[Mobject] = [self]
+        # Incremented whenever the family, or how many points any member
+        # has, changes, both for this mobject and all its ancestors
+        self.family_version: int = 0
+        # Incremented whenever the parents of this mobject, or of any of
+        # its ancestors, change
+        self.ancestry_version: int = 0
+        self.family_cache: dict[str, tuple[Hashable, list[Mobject]]] = dict()
         self.locked_data_keys: set[str] = set()
         self.needs_new_bounding_box: bool = True
         self._is_animating: bool = False
@@ -99,6 +113,9 @@ class Mobject(object):
         self.target = None
 
         self.init_data()
+        if not isinstance(self.data, CopyOnWriteDict):
+            self.data = CopyOnWriteDict(self.data)
+        self.data.resize_callback = self.note_data_resize
         self.init_uniforms()
         self.init_updaters()
         self.init_event_listners()
@@ -109,6 +126,17 @@ class Mobject(object):
         if self.depth_test:
             self.apply_depth_test()
 
+    def __getattr__(self, name: str):
+        # Members of a mobject read from a file only link up
+        # with the rest of its family once they're used
+        if name in ("submobjects", "parents", "family") and "file_member" in self.__dict__:
+            file_reader, _ = self.__dict__["file_member"]
+            file_reader.build_member_links(self, name)
+            return self.__dict__[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
     def __str__(self):
         return self.__class__.__name__
 
@@ -121,11 +149,11 @@ class Mobject(object):
         return self.replicate(other)
 
     def init_data(self):
-        self.data: dict[str, np.ndarray] = {
+        self.data: CopyOnWriteDict = CopyOnWriteDict({
             "points": np.zeros((0, 3)),
             "bounding_box": np.zeros((3, 3)),
             "rgbas": np.zeros((1, 4)),
-        }
+        })
 
     def init_uniforms(self):
         self.uniforms: dict[str, float] = {
@@ -143,6 +171,9 @@ class Mobject(object):
         pass
 
     def set_data(self, data: dict):
+        if isinstance(data, CopyOnWriteDict):
+            self.data.share_from(data)
+            return self
         for key in data:
             self.data[key] = data[key].copy()
         return self
@@ -205,9 +236,10 @@ class Mobject(object):
         for mob in self.get_family():
             arrs = []
             if mob.has_points():
-                arrs.append(mob.get_points())
+                arrs.append(mob.data["points"])
             if works_on_bounding_box:
-                arrs.append(mob.get_bounding_box())
+                mob.get_bounding_box()  # Recompute if needed
+                arrs.append(mob.data["bounding_box"])
 
             for arr in arrs:
                 if about_point is None:
@@ -229,13 +261,16 @@ class Mobject(object):
         return self
 
     def get_points(self) -> np.ndarray:
+        # This may be written to, so it goes through data["points"],
+        # which first un-shares it from any copies.  Internal reads
+        # use data.peek("points") instead.
         return self.data["points"]
 
     def clear_points(self) -> None:
         self.resize_points(0)
 
     def get_num_points(self) -> int:
-        return len(self.data["points"])
+        return len(self.data.peek("points"))
 
     def get_all_points(self) -> np.ndarray:
         if self.submobjects:
@@ -250,13 +285,13 @@ class Mobject(object):
         if self.needs_new_bounding_box:
             self.data["bounding_box"] = self.compute_bounding_box()
             self.needs_new_bounding_box = False
-        return self.data["bounding_box"]
+        return self.data.peek("bounding_box")
 
     def compute_bounding_box(self) -> np.ndarray:
         all_points = np.vstack([
-            self.get_points(),
+            self.data.peek("points"),
             *(
-                mob.get_bounding_box()
+                mob.get_bounding_box()  # Recompute if needed
                 for mob in self.get_family()[1:]
                 if mob.has_points()
             )
@@ -325,6 +360,7 @@ class Mobject(object):
         return self.submobjects
 
     def assemble_family(self):
+        self.family_version += 1
         sub_families = (sm.get_family() for sm in self.submobjects)
         self.family = [self, *it.chain(*sub_families)]
         self.refresh_has_updater_status()
@@ -339,8 +375,44 @@ class Mobject(object):
         else:
             return [self]
 
+    def increment_family_version(self) -> None:
+        to_process = [self]
+        processed = set()
+        while to_process:
+            mob = to_process.pop()
+            if mob not in processed:
+                mob.family_version += 1
+                processed.add(mob)
+                to_process.extend(mob.parents)
+
+    def increment_ancestry_version(self) -> None:
+        for mob in self.get_family():
+            mob.ancestry_version += 1
+
+    def note_data_resize(self, key: str) -> None:
+        # Called by self.data whenever one of its arrays changes length
+        if key == "points":
+            self.increment_family_version()
+
+    def get_cached_traversal(
+        self,
+        key: str,
+        version: Hashable,
+        get_members: Callable[[], list[Mobject]]
+    ) -> list[Mobject]:
+        cached = self.family_cache.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, get_members())
+            self.family_cache[key] = cached
+        # Return a copy, so that callers are free to modify it
+        return list(cached[1])
+
     def family_members_with_points(self):
-        return [m for m in self.get_family() if m.has_points()]
+        return self.get_cached_traversal(
+            "with_points",
+            self.family_version,
+            lambda: [m for m in self.get_family() if m.has_points()]
+        )
 
     def get_ancestors(self, extended: bool = False) -> list[Mobject]:
         """
@@ -350,6 +422,25 @@ class Mobject(object):
         If extended is set to true, it includes the ancestors of all family members,
         e.g. any other parents of a submobject
         """
+        if extended:
+            # This depends on the parents of every family member.  Those
+            # versions only ever go up, so their sum changes whenever
+            # any of them does.
+            return self.get_cached_traversal(
+                "extended_ancestors",
+                (
+                    self.family_version,
+                    sum(mob.ancestry_version for mob in self.get_family()),
+                ),
+                lambda: self.find_ancestors(extended)
+            )
+        return self.get_cached_traversal(
+            "ancestors",
+            self.ancestry_version,
+            lambda: self.find_ancestors(extended)
+        )
+
+    def find_ancestors(self, extended: bool = False) -> list[Mobject]:
         ancestors = []
         to_process = list(self.get_family(recurse=extended))
         excluded = set(to_process)
@@ -371,6 +462,7 @@ class Mobject(object):
                 self.submobjects.append(mobject)
             if self not in mobject.parents:
                 mobject.parents.append(self)
+                mobject.increment_ancestry_version()
         self.assemble_family()
         return self
 
@@ -380,8 +472,11 @@ class Mobject(object):
                 self.submobjects.remove(mobject)
             if self in mobject.parents:
                 mobject.parents.remove(self)
+                mobject.increment_ancestry_version()
         if reassemble:
             self.assemble_family()
+        else:
+            self.increment_family_version()
         return self
 
     def add_to_back(self, *mobjects: Mobject):
@@ -392,6 +487,7 @@ class Mobject(object):
         old_submob = self.submobjects[index]
         if self in old_submob.parents:
             old_submob.parents.remove(self)
+            old_submob.increment_ancestry_version()
         self.submobjects[index] = new_submob
         self.assemble_family()
         return self
@@ -525,13 +621,13 @@ class Mobject(object):
     def stash_mobject_pointers(func):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            uncopied_attrs = ["parents", "target", "saved_state"]
+            uncopied_attrs = ["parents", "target", "saved_state", "family_cache"]
             stash = dict()
             for attr in uncopied_attrs:
                 if hasattr(self, attr):
                     value = getattr(self, attr)
                     stash[attr] = value
-                    null_value = [] if isinstance(value, list) else None
+                    null_value = type(value)() if isinstance(value, (list, dict)) else None
                     setattr(self, attr, null_value)
             result = func(self, *args, **kwargs)
             self.__dict__.update(stash)
@@ -558,15 +654,17 @@ class Mobject(object):
         if deep:
             return self.deepcopy()
 
+        # For members of a mobject read from a file, this builds the rest
+        # of the family first, so that the copy isn't linked to the file
+        family = self.get_family()
         result = copy.copy(self)
 
         # The line above is only a shallow copy, so the internal
         # data which are numpyu arrays or other mobjects still
-        # need to be further copied.
-        result.data = {
-            key: np.array(value)
-            for key, value in self.data.items()
-        }
+        # need to be further copied.  Data arrays are shared until
+        # either side writes to them.
+        result.data = self.data.copy()
+        result.data.resize_callback = result.note_data_resize
         result.uniforms = {
             key: np.array(value)
             for key, value in self.uniforms.items()
@@ -585,15 +683,19 @@ class Mobject(object):
         result.non_time_updaters = list(self.non_time_updaters)
         result.time_based_updaters = list(self.time_based_updaters)
 
-        family = self.get_family()
+        # Unless some data is locked, shader data will be
+        # refilled before it's used, so there's no need to copy it
+        copy_shader_data = bool(self.locked_data_keys)
         for attr, value in list(self.__dict__.items()):
             if isinstance(value, Mobject) and value is not self:
                 if value in family:
                     setattr(result, attr, result.family[self.family.index(value)])
             if isinstance(value, np.ndarray):
+                if not copy_shader_data and attr in self.shader_buffer_attrs:
+                    value = value[:0]
                 setattr(result, attr, value.copy())
             if isinstance(value, ShaderWrapper):
-                setattr(result, attr, value.copy())
+                setattr(result, attr, value.copy(copy_data=copy_shader_data))
         return result
 
     def generate_target(self, use_deepcopy: bool = False):
@@ -613,16 +715,29 @@ class Mobject(object):
         return self
 
     def save_to_file(self, file_path: str, supress_overwrite_warning: bool = False):
-        with open(file_path, "wb") as fp:
-            fp.write(self.serialize())
+        """
+        Mobjects made only of the types listed in manimlib.utils.mobject_file,
+        or subclasses of VMobject and PMobject, are saved in its compact array
+        format, and others are pickled.
+        """
+        from manimlib.utils.mobject_file import write_mobject_file
+        try:
+            write_mobject_file(self, file_path)
+        except ValueError as err:
+            log.debug(f"{err}, so it will be pickled")
+            with open(file_path, "wb") as fp:
+                fp.write(self.serialize())
         log.info(f"Saved mobject to {file_path}")
         return self
 
     @staticmethod
-    def load(file_path):
+    def load(file_path: str, mmap: bool = True):
         if not os.path.exists(file_path):
             log.error(f"No file found at {file_path}")
             sys.exit(2)
+        if is_array_file(file_path):
+            from manimlib.utils.mobject_file import read_mobject_file
+            return read_mobject_file(file_path, mmap=mmap)
         with open(file_path, "rb") as fp:
             mobject = pickle.load(fp)
         return mobject
@@ -651,24 +766,34 @@ class Mobject(object):
             self.match_updaters(mobject)
         return self
 
+    def get_fingerprint(self) -> bytes:
+        """
+        Digest of this mobject's own data and uniforms.  Hashes of data
+        arrays are cached until they're next written through data[key],
+        and copies share the hashes of the original.
+        """
+        hasher = hashlib.sha1(self.data.get_fingerprint())
+        for key in sorted(self.uniforms):
+            value = self.uniforms[key]
+            hasher.update(key.encode())
+            if isinstance(value, np.ndarray) and value.ndim == 0:
+                value = value.item()
+            if isinstance(value, np.ndarray):
+                hasher.update(f"{value.dtype.str}{value.shape}".encode())
+                hasher.update(np.ascontiguousarray(value))
+            else:
+                hasher.update(repr(value).encode())
+        return hasher.digest()
+
     def looks_identical(self, mobject: Mobject):
         fam1 = self.family_members_with_points()
         fam2 = mobject.family_members_with_points()
         if len(fam1) != len(fam2):
             return False
-        for m1, m2 in zip(fam1, fam2):
-            for d1, d2 in [(m1.data, m2.data), (m1.uniforms, m2.uniforms)]:
-                if set(d1).difference(d2):
-                    return False
-                for key in d1:
-                    eq = (d1[key] == d2[key])
-                    if isinstance(eq, bool):
-                        if not eq:
-                            return False
-                    else:
-                        if not eq.all():
-                            return False
-        return True
+        return all(
+            m1.get_fingerprint() == m2.get_fingerprint()
+            for m1, m2 in zip(fam1, fam2)
+        )
 
     # Creating new Mobjects from this one
 
@@ -1646,7 +1771,7 @@ class Mobject(object):
         for key in self.data:
             if key in self.locked_data_keys:
                 continue
-            if len(self.data[key]) == 0:
+            if len(self.data.peek(key)) == 0:
                 continue
             if key not in mobject1.data or key not in mobject2.data:
                 continue
@@ -1657,8 +1782,8 @@ class Mobject(object):
                 func = interpolate
 
             self.data[key][:] = func(
-                mobject1.data[key],
-                mobject2.data[key],
+                mobject1.data.peek(key),
+                mobject2.data.peek(key),
                 alpha
             )
         for key in self.uniforms:
@@ -1698,7 +1823,7 @@ class Mobject(object):
         for sm, sm1, sm2 in zip(self.get_family(), mobject1.get_family(), mobject2.get_family()):
             keys = sm.data.keys() & sm1.data.keys() & sm2.data.keys()
             sm.lock_data(list(filter(
-                lambda key: np.all(sm1.data[key] == sm2.data[key]),
+                lambda key: np.all(sm1.data.peek(key) == sm2.data.peek(key)),
                 keys,
             )))
         return self
@@ -1793,7 +1918,7 @@ class Mobject(object):
 
     def init_shader_data(self):
         # TODO, only call this when needed?
-        self.shader_data = np.zeros(len(self.get_points()), dtype=self.shader_dtype)
+        self.shader_data = np.zeros(self.get_num_points(), dtype=self.shader_dtype)
         self.shader_indices = None
         self.shader_wrapper = ShaderWrapper(
             vert_data=self.shader_data,
@@ -1835,7 +1960,7 @@ class Mobject(object):
         # Makes sure that self.data[key] can be broadcast into
         # the given array, meaning its length has to be either 1
         # or the length of the array
-        d_len = len(self.data[data_key])
+        d_len = len(self.data.peek(data_key))
         if d_len != 1 and d_len != len(array):
             self.data[data_key] = resize_with_interpolation(
                 self.data[data_key], len(array)
@@ -1858,7 +1983,7 @@ class Mobject(object):
         if data_key in self.locked_data_keys:
             return
         self.check_data_alignment(shader_data, data_key)
-        shader_data[shader_data_key] = self.data[data_key]
+        shader_data[shader_data_key] = self.data.peek(data_key)
 
     def get_shader_data(self):
         shader_data = self.get_resized_shader_data_array(self.get_num_points())
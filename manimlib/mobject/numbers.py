@@ -3,9 +3,11 @@ from __future__ import annotations
 import numpy as np
 
 from manimlib.constants import DOWN, LEFT, RIGHT, UP
+from manimlib.mobject.svg.svg_mobject import MobjectCache
 from manimlib.mobject.svg.tex_mobject import SingleStringTex
 from manimlib.mobject.svg.text_mobject import Text
 from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.iterables import hash_obj
 
 from typing import TYPE_CHECKING
 
@@ -15,6 +17,11 @@ if TYPE_CHECKING:
     T = TypeVar("T", bound=VMobject)
 
 
+# Rendered characters, keyed by the character along with the text
+# config (font, font_size, etc.) used to render it
+DECIMAL_GLYPH_CACHE = MobjectCache()
+
+
 class DecimalNumber(VMobject):
     CONFIG = {
         "stroke_width": 0,
@@ -38,12 +45,17 @@ class DecimalNumber(VMobject):
 
     def set_submobjects_from_number(self, number: float | complex) -> None:
         self.number = number
+        old_submobs = list(self.submobjects)
         self.set_submobjects([])
         self.text_config["font_size"] = self.get_font_size()
         num_string = self.num_string = self.get_num_string(number)
+        config_hash = hash_obj(self.text_config)
         self.add(*(
-            Text(ns, **self.text_config)
-            for ns in num_string
+            self.get_char_mobject(
+                char, config_hash,
+                old_submobs[i] if i < len(old_submobs) else None
+            )
+            for i, char in enumerate(num_string)
         ))
 
         # Add non-numerical bits
@@ -74,6 +86,47 @@ class DecimalNumber(VMobject):
         if self.include_background_rectangle:
             self.add_background_rectangle()
 
+    def get_char_mobject(
+        self,
+        char: str,
+        config_hash: int,
+        old_submob: VMobject | None = None
+    ) -> VMobject:
+        """
+        Characters are rendered once per text config and then copied.  If
+        old_submob is a previously copied character with the same structure,
+        it's reused instead, with the cached glyph's data copied into it.
+        """
+        key = (char, config_hash)
+        glyph = DECIMAL_GLYPH_CACHE.get(key)
+        if glyph is None:
+            glyph = Text(char, **self.text_config)
+            for mob in glyph.family_members_with_points():
+                mob.get_triangulation()
+            glyph.glyph_key = key
+            DECIMAL_GLYPH_CACHE.add(key, glyph)
+        reusable = (
+            old_submob is not None
+            and getattr(old_submob, "glyph_key", None) is not None
+            and len(old_submob.get_family()) == len(glyph.get_family())
+        )
+        if not reusable:
+            return glyph.copy()
+        new_glyph = old_submob.glyph_key != key
+        old_submob.glyph_key = key
+        for mob, glyph_mob in zip(old_submob.get_family(), glyph.get_family()):
+            # Unlike set_data, this doesn't recompute normals and triangulations,
+            # since those are copied over as well
+            mob.data.share_from(glyph_mob.data)
+            mob.needs_new_bounding_box = glyph_mob.needs_new_bounding_box
+            mob.triangulation = glyph_mob.triangulation
+            mob.needs_new_triangulation = glyph_mob.needs_new_triangulation
+            if new_glyph and isinstance(mob, VMobject):
+                # So that nothing cached against the old glyph's
+                # triangulation is used for this one
+                mob.topology_version += 1
+        return old_submob
+
     def get_num_string(self, number: float | complex) -> str:
         if isinstance(number, complex):
             formatter = self.get_complex_formatter()
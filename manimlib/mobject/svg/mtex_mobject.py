@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import re
 
+from manimlib.constants import WHITE
 from manimlib.mobject.svg.string_mobject import StringMobject
+from manimlib.utils.config_ops import digest_config
 from manimlib.utils.tex_file_writing import display_during_execution
+from manimlib.utils.tex_file_writing import queue_tex_content
 from manimlib.utils.tex_file_writing import tex_content_to_svg_file
 
 from typing import TYPE_CHECKING
@@ -69,6 +72,35 @@ class MTex(StringMobject):
             self.additional_preamble
         )
 
+    @classmethod
+    def queue(cls, tex_string: str, **kwargs) -> None:
+        """
+        Queues the tex which constructing cls(tex_string, **kwargs) would
+        need compiled, without constructing it.  Everything queued ahead of
+        the first mobject that's actually constructed gets compiled together.
+        """
+        stand_in = cls.__new__(cls)
+        if not tex_string.strip():
+            tex_string = "\\\\"
+        stand_in.tex_string = stand_in.string = tex_string
+        digest_config(stand_in, kwargs)
+        if stand_in.base_color is None:
+            stand_in.base_color = WHITE
+        stand_in.parse()
+        stand_in.queue_tex()
+
+    def queue_tex(self) -> None:
+        # The labelled svg is compiled along with the original one
+        contents = [self.get_content(is_labelled=False)]
+        if len(self.labelled_spans) > 1:
+            contents.append(self.get_content(is_labelled=True))
+        for content in contents:
+            queue_tex_content(content, self.template, self.additional_preamble)
+
+    def get_file_path(self) -> str:
+        self.queue_tex()
+        return super().get_file_path()
+
     def get_file_path_by_content(self, content: str) -> str:
         with display_during_execution(f"Writing \"{self.tex_string}\""):
             file_path = tex_content_to_svg_file(
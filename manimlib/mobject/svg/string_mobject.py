@@ -84,8 +84,8 @@ class StringMobject(SVGMobject, ABC):
     def get_file_path_by_content(self, content: str) -> str:
         return ""
 
-    def generate_mobject(self) -> None:
-        super().generate_mobject()
+    def generate_mobject(self, file_path: str | None = None) -> None:
+        super().generate_mobject(file_path)
 
         labels_count = len(self.labelled_spans)
         if labels_count == 1:
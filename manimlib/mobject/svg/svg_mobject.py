@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+import io
 import os
 from xml.etree import ElementTree as ET
 
 import numpy as np
 import svgelements as se
 
+from manimlib import __version__
 from manimlib.constants import RIGHT
 from manimlib.logger import log
 from manimlib.mobject.geometry import Circle
@@ -15,13 +18,115 @@ from manimlib.mobject.geometry import Polyline
 from manimlib.mobject.geometry import Rectangle
 from manimlib.mobject.geometry import RoundedRectangle
 from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.array_io import read_array_file
+from manimlib.utils.array_io import write_array_file
+from manimlib.utils.customization import get_customization
 from manimlib.utils.directories import get_mobject_data_dir
+from manimlib.utils.hashing import get_content_hash
+from manimlib.utils.hashing import get_file_hash
 from manimlib.utils.images import get_full_vector_image_path
 from manimlib.utils.iterables import hash_obj
 from manimlib.utils.simple_functions import hash_string
 
+from typing import TYPE_CHECKING
 
-SVG_HASH_TO_MOB_MAP: dict[int, VMobject] = {}
+if TYPE_CHECKING:
+    from typing import Hashable, Iterable
+
+
+class MobjectCache(object):
+    """
+    Map from hash values to mobjects which keeps at most max_bytes worth of
+    their point data, as estimated from their arrays, evicting those least
+    recently used first.  If max_bytes is None, it's read from the
+    svg_cache_max_mb entry of the custom config on first use.
+    """
+    def __init__(self, max_bytes: int | None = None):
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[Hashable, tuple[VMobject, int]] = OrderedDict()
+        self.n_bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+
+    def get_max_bytes(self) -> int:
+        if self.max_bytes is None:
+            max_mb = get_customization().get("svg_cache_max_mb", 256)
+            self.max_bytes = int(max_mb * 1024 * 1024)
+        return self.max_bytes
+
+    @staticmethod
+    def estimate_size(mobject: VMobject) -> int:
+        return sum(
+            sum(array.nbytes for array in mob.data.values())
+            + getattr(mob, "triangulation", np.zeros(0)).nbytes
+            for mob in mobject.get_family()
+        )
+
+    def get(self, key: Hashable) -> VMobject | None:
+        if key not in self.entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return self.entries[key][0]
+
+    def add(self, key: Hashable, mobject: VMobject) -> None:
+        self.remove(key)
+        size = self.estimate_size(mobject)
+        max_bytes = self.get_max_bytes()
+        if size > max_bytes:
+            return
+        while self.n_bytes + size > max_bytes:
+            self.remove(next(iter(self.entries)))
+            self.evictions += 1
+        self.entries[key] = (mobject, size)
+        self.n_bytes += size
+
+    def remove(self, key: Hashable) -> None:
+        if key in self.entries:
+            self.n_bytes -= self.entries.pop(key)[1]
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.n_bytes = 0
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self.entries),
+            "bytes": self.n_bytes,
+            "max_bytes": self.get_max_bytes(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+SVG_HASH_TO_MOB_MAP = MobjectCache()
+# Glyphs which svgs reference through <use>, as untransformed paths
+SVG_GLYPH_CACHE = MobjectCache()
+
+# Bump when what gets saved for a parsed svg changes
+SVG_CACHE_VERSION = 1
+
+# Svgs built only from these, like those from dvisvgm, are
+# turned into shapes directly rather than through svgelements
+SIMPLE_SVG_TAGS = {"svg", "g", "defs", "path", "use", "rect"}
+SVG_STYLE_ATTRIBUTES = {
+    "fill", "fill-opacity", "stroke", "stroke-opacity", "stroke-width"
+}
+XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+SIMPLE_SVG_ATTRIBUTES = {
+    *SVG_STYLE_ATTRIBUTES,
+    "id", "d", "x", "y", "width", "height", "rx", "ry", "transform",
+    "href", XLINK_HREF,
+}
 
 
 def _convert_point_to_3d(x: float, y: float) -> np.ndarray:
@@ -65,13 +170,18 @@ class SVGMobject(VMobject):
 
     def init_svg_mobject(self) -> None:
         hash_val = hash_obj(self.hash_seed)
-        if hash_val in SVG_HASH_TO_MOB_MAP:
-            mob = SVG_HASH_TO_MOB_MAP[hash_val].copy()
-            self.add(*mob)
+        cached_mob = SVG_HASH_TO_MOB_MAP.get(hash_val)
+        if cached_mob is not None:
+            self.add(*cached_mob.copy())
             return
 
-        self.generate_mobject()
-        SVG_HASH_TO_MOB_MAP[hash_val] = self.copy()
+        # For tex, getting the path compiles the file if needed
+        file_path = self.get_file_path()
+        cache_path = self.get_svg_cache_path(file_path)
+        if not self.load_from_svg_cache(cache_path):
+            self.generate_mobject(file_path)
+            self.save_to_svg_cache(cache_path)
+        SVG_HASH_TO_MOB_MAP.add(hash_val, self.copy())
 
     @property
     def hash_seed(self) -> tuple:
@@ -84,21 +194,100 @@ class SVGMobject(VMobject):
             self.file_name
         )
 
-    def generate_mobject(self) -> None:
-        file_path = self.get_file_path()
+    # Parsed svgs are also saved to disk, so that other processes
+    # needn't parse and triangulate them again
+    def get_svg_cache_path(self, file_path: str) -> str:
+        key = get_content_hash(
+            SVG_CACHE_VERSION,
+            __version__,
+            self.hash_seed,
+            get_file_hash(file_path),
+        )
+        return os.path.join(get_mobject_data_dir(), f"{key[:32]}_svg.arr")
+
+    def load_from_svg_cache(self, cache_path: str) -> bool:
+        if not os.path.exists(cache_path):
+            return False
+        try:
+            arrays, metadata = read_array_file(cache_path)
+        except (OSError, ValueError, KeyError):
+            return False
+
+        submobs = []
+        for index, info in enumerate(metadata["submobjects"]):
+            submob = VMobject()
+            for key in metadata["data_keys"]:
+                start, end = arrays[key + "_offsets"][index:index + 2]
+                submob.data[key] = np.array(arrays[key][start:end])
+            submob.uniforms.update(info["uniforms"])
+            start, end = arrays["triangulation_offsets"][index:index + 2]
+            submob.triangulation = np.array(arrays["triangulation"][start:end])
+            submob.needs_new_triangulation = False
+            if info["label"] is not None:
+                submob.label = info["label"]
+            submobs.append(submob)
+        self.add(*submobs)
+        return True
+
+    def save_to_svg_cache(self, cache_path: str) -> None:
+        submobs = self.submobjects
+        if any(sm.submobjects for sm in submobs):
+            return
+        data_keys = list(submobs[0].data.keys()) if submobs else []
+        if any(list(sm.data.keys()) != data_keys for sm in submobs):
+            return
+
+        arrays = {}
+        for key, sm_arrays in [
+            *((key, [sm.data[key] for sm in submobs]) for key in data_keys),
+            ("triangulation", [sm.get_triangulation() for sm in submobs]),
+        ]:
+            lengths = [len(array) for array in sm_arrays]
+            arrays[key + "_offsets"] = np.cumsum([0, *lengths])
+            if sm_arrays:
+                arrays[key] = np.concatenate(sm_arrays)
+            else:
+                arrays[key] = np.zeros(0)
+        metadata = {
+            "data_keys": data_keys,
+            "submobjects": [
+                {
+                    "uniforms": {
+                        key: np.asarray(value).tolist()
+                        for key, value in sm.uniforms.items()
+                    },
+                    "label": int(sm.label) if hasattr(sm, "label") else None,
+                }
+                for sm in submobs
+            ],
+        }
+        try:
+            write_array_file(cache_path, arrays, metadata)
+        except OSError as err:
+            log.debug("Couldn't save svg cache file: %s", err)
+
+    def generate_mobject(self, file_path: str | None = None) -> None:
+        if file_path is None:
+            file_path = self.get_file_path()
         element_tree = ET.parse(file_path)
         new_tree = self.modify_xml_tree(element_tree)
-        # Create a temporary svg file to dump modified svg to be parsed
-        root, ext = os.path.splitext(file_path)
-        modified_file_path = root + "_" + ext
-        new_tree.write(modified_file_path)
-
-        svg = se.SVG.parse(modified_file_path)
-        os.remove(modified_file_path)
-
-        mobjects = self.get_mobjects_from(svg)
+        shapes = self.get_simple_svg_shapes(new_tree)
+        if shapes is None:
+            # Hand the modified svg to svgelements from memory
+            buffer = io.BytesIO()
+            new_tree.write(buffer)
+            buffer.seek(0)
+            shapes = se.SVG.parse(buffer).elements()
+
+        mobjects = self.get_mobjects_from_shapes(shapes)
         self.add(*mobjects)
         self.flip(RIGHT)  # Flip y
+        for mob in mobjects:
+            # Glyphs come with a triangulation for this orientation
+            glyph_triangulation = getattr(mob, "flipped_triangulation", None)
+            if glyph_triangulation is not None:
+                mob.triangulation = glyph_triangulation
+                mob.needs_new_triangulation = False
 
     def get_file_path(self) -> str:
         if self.file_name is None:
@@ -147,9 +336,153 @@ class SVGMobject(VMobject):
                 result[svg_key] = str(svg_default_dict[style_key])
         return result
 
+    def get_simple_svg_shapes(
+        self, element_tree: ET.ElementTree
+    ) -> list[se.Shape | VMobject] | None:
+        """
+        Returns the shapes svgelements would find, reified in the same way,
+        for svgs only made of paths, rects and <use> references to them
+        within groups.  Glyphs referenced through <use> come back as
+        mobjects already.  For any other svg, returns None.
+        """
+        root = element_tree.getroot()
+        id_to_element = {}
+        for elem in root.iter():
+            if elem.tag.split("}")[-1] not in SIMPLE_SVG_TAGS:
+                return None
+            if not SIMPLE_SVG_ATTRIBUTES.issuperset(elem.attrib):
+                return None
+            if "id" in elem.attrib:
+                id_to_element[elem.attrib["id"]] = elem
+
+        result = []
+        try:
+            self.add_simple_svg_shapes(root, se.Matrix(), {}, id_to_element, result)
+        except (KeyError, ValueError, RecursionError):
+            return None
+        return result
+
+    def add_simple_svg_shapes(
+        self,
+        elem: ET.Element,
+        matrix: se.Matrix,
+        style: dict[str, str],
+        id_to_element: dict[str, ET.Element],
+        result: list[se.Shape | VMobject]
+    ) -> None:
+        tag = elem.tag.split("}")[-1]
+        if tag == "defs":
+            return
+        attrib = elem.attrib
+        if "transform" in attrib:
+            matrix = se.Matrix(attrib["transform"]) * matrix
+        style = {
+            **style,
+            **{k: v for k, v in attrib.items() if k in SVG_STYLE_ATTRIBUTES}
+        }
+
+        if tag in ("svg", "g"):
+            for child in elem:
+                self.add_simple_svg_shapes(child, matrix, style, id_to_element, result)
+            return
+        if tag == "use":
+            href = attrib.get(XLINK_HREF, attrib.get("href", ""))
+            if not href.startswith("#"):
+                raise ValueError(f"Unsupported reference {href}")
+            matrix = se.Matrix("translate({}, {})".format(
+                attrib.get("x", 0), attrib.get("y", 0)
+            )) * matrix
+            target = id_to_element[href[1:]]
+            if self.is_glyph(target):
+                mob = self.glyph_to_mobject(target.attrib["d"], matrix, style)
+                if mob.has_points():
+                    result.append(mob)
+                return
+            self.add_simple_svg_shapes(
+                target, matrix, style, id_to_element, result
+            )
+            return
+
+        style_kwargs = self.get_simple_svg_style_kwargs(matrix, style)
+        if tag == "path":
+            shape = se.Path(attrib.get("d", ""), **style_kwargs)
+        else:
+            shape = se.Rect(*(
+                float(attrib.get(key, 0))
+                for key in ("x", "y", "width", "height")
+            ), *(
+                float(attrib[key]) if key in attrib else None
+                for key in ("rx", "ry")
+            ), **style_kwargs)
+        result.append(shape.reify())
+
+    @staticmethod
+    def get_simple_svg_style_kwargs(
+        matrix: se.Matrix, style: dict[str, str]
+    ) -> dict:
+        fill = se.Color(style.get("fill", "black"))
+        stroke = se.Color(style.get("stroke", "none"))
+        for color, key in [(fill, "fill-opacity"), (stroke, "stroke-opacity")]:
+            if key in style and color.value is not None:
+                color.opacity *= float(style[key])
+        return dict(
+            transform=matrix,
+            fill=fill,
+            stroke=stroke,
+            stroke_width=float(style.get("stroke-width", 1.0)),
+        )
+
+    @staticmethod
+    def is_glyph(elem: ET.Element) -> bool:
+        # A referenced path whose instances can all share its points
+        return all([
+            elem.tag.split("}")[-1] == "path",
+            "d" in elem.attrib,
+            "transform" not in elem.attrib,
+            not SVG_STYLE_ATTRIBUTES.intersection(elem.attrib),
+        ])
+
+    def get_glyph(self, path_string: str) -> VMobjectFromSVGPath:
+        """
+        Glyphs are cached by their path data, which pins down both the font
+        and the character, so each is only traced and triangulated once.
+        """
+        key = hash_obj((path_string, self.path_string_config))
+        glyph = SVG_GLYPH_CACHE.get(key)
+        if glyph is None:
+            glyph = VMobjectFromSVGPath(se.Path(path_string), **self.path_string_config)
+            # Triangulated as it will be once the svg is flipped right side up,
+            # which stays valid under any orientation preserving affine map
+            glyph.flipped_triangulation = glyph.copy().flip(RIGHT).get_triangulation()
+            SVG_GLYPH_CACHE.add(key, glyph)
+        return glyph
+
+    def glyph_to_mobject(
+        self,
+        path_string: str,
+        matrix: se.Matrix,
+        style: dict[str, str]
+    ) -> VMobjectFromSVGPath:
+        mob = self.get_glyph(path_string).copy()
+        self.handle_transform(mob, matrix)
+        if matrix.determinant <= 0:
+            mob.flipped_triangulation = None
+        shape = se.Path(**self.get_simple_svg_style_kwargs(matrix, style))
+        self.apply_style_to_mobject(mob, shape.reify())
+        return mob
+
     def get_mobjects_from(self, svg: se.SVG) -> list[VMobject]:
+        return self.get_mobjects_from_shapes(svg.elements())
+
+    def get_mobjects_from_shapes(
+        self, shapes: Iterable[se.SVGElement | VMobject]
+    ) -> list[VMobject]:
         result = []
-        for shape in svg.elements():
+        for shape in shapes:
+            if isinstance(shape, VMobject):
+                # Already built, as for glyphs
+                result.append(shape)
+                continue
             if isinstance(shape, (se.Group, se.Use)):
                 continue
             elif isinstance(shape, se.Path):
@@ -13,6 +13,7 @@ from manimlib.mobject.svg.svg_mobject import SVGMobject
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.utils.config_ops import digest_config
 from manimlib.utils.tex_file_writing import display_during_execution
+from manimlib.utils.tex_file_writing import queue_tex_content
 from manimlib.utils.tex_file_writing import tex_content_to_svg_file
 
 from typing import TYPE_CHECKING
@@ -70,6 +71,29 @@ class SingleStringTex(SVGMobject):
             self.additional_preamble
         )
 
+    @classmethod
+    def queue(cls, *args, **kwargs) -> None:
+        """
+        Queues the tex which constructing cls(*args, **kwargs) would need
+        compiled, without constructing it.  Everything queued ahead of the
+        first mobject that's actually constructed gets compiled together.
+        """
+        stand_in = cls.__new__(cls)
+        stand_in.init_tex_attributes(*args, **kwargs)
+        stand_in.queue_tex()
+
+    def init_tex_attributes(self, tex_string: str, **kwargs) -> None:
+        # Only those attributes which determine the tex to compile
+        digest_config(self, kwargs)
+        self.tex_string = tex_string
+
+    def queue_tex(self) -> None:
+        queue_tex_content(
+            self.get_tex_file_body(self.tex_string),
+            self.template,
+            self.additional_preamble
+        )
+
     def get_file_path(self) -> str:
         content = self.get_tex_file_body(self.tex_string)
         with display_during_execution(f"Writing \"{self.tex_string}\""):
@@ -190,6 +214,8 @@ class Tex(SingleStringTex):
         digest_config(self, kwargs)
         self.tex_strings = self.break_up_tex_strings(tex_strings)
         full_string = self.arg_separator.join(self.tex_strings)
+        # So that the pieces get compiled along with the full string
+        self.queue_substring_tex()
         super().__init__(full_string, **kwargs)
         self.break_up_by_substrings()
         self.set_color_by_tex_to_color_map(self.tex_to_color_map)
@@ -228,8 +254,7 @@ class Tex(SingleStringTex):
             return self
         new_submobjects = []
         curr_index = 0
-        config = dict(self.CONFIG)
-        config["alignment"] = ""
+        config = self.get_substring_config()
         for tex_string in self.tex_strings:
             tex_string = tex_string.strip()
             if len(tex_string) == 0:
@@ -245,6 +270,37 @@ class Tex(SingleStringTex):
         self.set_submobjects(new_submobjects)
         return self
 
+    def init_tex_attributes(self, *tex_strings: str, **kwargs) -> None:
+        digest_config(self, kwargs)
+        self.tex_strings = self.break_up_tex_strings(tex_strings)
+        self.tex_string = self.arg_separator.join(self.tex_strings)
+
+    def queue_tex(self) -> None:
+        self.queue_substring_tex()
+        super().queue_tex()
+
+    def get_substring_config(self) -> dict:
+        config = dict(self.CONFIG)
+        config["alignment"] = ""
+        return config
+
+    def queue_substring_tex(self) -> None:
+        if len(self.tex_strings) == 1:
+            return
+        config = self.get_substring_config()
+        # Stand-in with the settings each SingleStringTex piece will have
+        sub_tex = SingleStringTex.__new__(SingleStringTex)
+        digest_config(sub_tex, config)
+        for tex_string in self.tex_strings:
+            tex_string = tex_string.strip()
+            if len(tex_string) == 0:
+                continue
+            queue_tex_content(
+                sub_tex.get_tex_file_body(tex_string),
+                sub_tex.template,
+                sub_tex.additional_preamble
+            )
+
     def get_parts_by_tex(
         self,
         tex: str,
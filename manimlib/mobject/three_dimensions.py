@@ -80,6 +80,7 @@ class Sphere(Surface):
         "radius": 1,
         "u_range": (0, TAU),
         "v_range": (0, PI),
+        "batch_uv_func": True,
     }
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
@@ -96,11 +97,12 @@ class Torus(Surface):
         "v_range": (0, TAU),
         "r1": 3,
         "r2": 1,
+        "batch_uv_func": True,
     }
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
-        P = np.array([math.cos(u), math.sin(u), 0])
-        return (self.r1 - self.r2 * math.cos(v)) * P - math.sin(v) * OUT
+        r = self.r1 - self.r2 * np.cos(v)
+        return np.array([r * np.cos(u), r * np.sin(u), -np.sin(v)])
 
 
 class Cylinder(Surface):
@@ -111,6 +113,7 @@ class Cylinder(Surface):
         "u_range": (0, TAU),
         "v_range": (-1, 1),
         "resolution": (101, 11),
+        "batch_uv_func": True,
     }
 
     def init_points(self):
@@ -147,6 +150,7 @@ class Disk3D(Surface):
         "u_range": (0, 1),
         "v_range": (0, TAU),
         "resolution": (2, 25),
+        "batch_uv_func": True,
     }
 
     def init_points(self) -> None:
@@ -157,7 +161,7 @@ class Disk3D(Surface):
         return np.array([
             u * np.cos(v),
             u * np.sin(v),
-            0
+            0 * u
         ])
 
 
@@ -167,6 +171,7 @@ class Square3D(Surface):
         "u_range": (-1, 1),
         "v_range": (-1, 1),
         "resolution": (2, 2),
+        "batch_uv_func": True,
     }
 
     def init_points(self) -> None:
@@ -174,7 +179,7 @@ class Square3D(Surface):
         self.scale(self.side_length / 2)
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
-        return np.array([u, v, 0])
+        return np.array([u, v, 0 * u])
 
 
 class Cube(SGroup):
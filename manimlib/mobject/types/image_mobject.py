@@ -6,6 +6,7 @@ from PIL import Image
 from manimlib.constants import DL, DR, UL, UR
 from manimlib.mobject.mobject import Mobject
 from manimlib.utils.bezier import inverse_interpolate
+from manimlib.utils.copy_on_write import CopyOnWriteDict
 from manimlib.utils.images import get_full_raster_image_path
 from manimlib.utils.iterables import listify
 
@@ -32,11 +33,11 @@ class ImageMobject(Mobject):
         self.texture_paths = {"Texture": path}
 
     def init_data(self) -> None:
-        self.data = {
+        self.data = CopyOnWriteDict({
             "points": np.array([UL, DL, UR, DR]),
             "im_coords": np.array([(0, 0), (0, 1), (1, 0), (1, 1)]),
             "opacity": np.array([[self.opacity]], dtype=np.float32),
-        }
+        })
 
     def init_points(self) -> None:
         size = self.image.size
@@ -10,6 +10,7 @@ from manimlib.utils.bezier import integer_interpolate
 from manimlib.utils.bezier import interpolate
 from manimlib.utils.images import get_full_raster_image_path
 from manimlib.utils.iterables import listify
+from manimlib.utils.space_ops import angle_between_vectors
 from manimlib.utils.space_ops import normalize_along_axis
 
 from typing import TYPE_CHECKING
@@ -39,6 +40,10 @@ class Surface(Mobject):
         # For du and dv steps.  Much smaller and numerical error
         # can crop up in the shaders.
         "epsilon": 1e-5,
+        # If True, uv_func is first called on arrays of u and v values,
+        # and should return an array of shape (3, len(u)).  If that call
+        # fails, it falls back to calling uv_func once per sample
+        "batch_uv_func": False,
         "render_primitive": moderngl.TRIANGLES,
         "depth_test": True,
         "shader_folder": "surface",
@@ -68,16 +73,37 @@ class Surface(Mobject):
         # - Points generated by pure uv values
         # - Those generated by values nudged by du
         # - Those generated by values nudged by dv
-        point_lists = []
-        for (du, dv) in [(0, 0), (self.epsilon, 0), (0, self.epsilon)]:
-            uv_grid = np.array([[[u + du, v + dv] for v in v_range] for u in u_range])
-            point_grid = np.apply_along_axis(lambda p: self.uv_func(*p), 2, uv_grid)
-            point_lists.append(point_grid.reshape((nu * nv, dim)))
+        u_grid, v_grid = np.meshgrid(u_range, v_range, indexing="ij")
+        nudges = [(0, 0), (self.epsilon, 0), (0, self.epsilon)]
+        u_values = np.hstack([u_grid.flatten() + du for du, dv in nudges])
+        v_values = np.hstack([v_grid.flatten() + dv for du, dv in nudges])
+
+        points = None
+        if self.batch_uv_func:
+            points = self.get_batched_uv_points(u_values, v_values)
+        if points is None:
+            points = np.array([
+                self.uv_func(u, v)
+                for u, v in zip(u_values, v_values)
+            ]).reshape((len(u_values), dim))
         # Rather than tracking normal vectors, the points list will hold on to the
         # infinitesimal nudged values alongside the original values.  This way, one
         # can perform all the manipulations they'd like to the surface, and normals
         # are still easily recoverable.
-        self.set_points(np.vstack(point_lists))
+        self.set_points(points)
+
+    def get_batched_uv_points(
+        self,
+        u_values: np.ndarray,
+        v_values: np.ndarray
+    ) -> np.ndarray | None:
+        try:
+            points = np.array(self.uv_func(u_values, v_values), dtype=float)
+        except (TypeError, ValueError):
+            return None
+        if points.shape != (self.dim, len(u_values)):
+            return None
+        return points.T
 
     def compute_triangle_indices(self):
         # TODO, if there is an event which changes
@@ -103,7 +129,7 @@ class Surface(Mobject):
     def get_surface_points_and_nudged_points(
         self
     ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-        points = self.get_points()
+        points = self.data.peek("points")
         k = len(points) // 3
         return points[:k], points[k:2 * k], points[2 * k:]
 
@@ -178,21 +204,38 @@ class Surface(Mobject):
 
     def sort_faces_back_to_front(self, vect: np.ndarray = OUT):
         tri_is = self.triangle_indices
-        indices = list(range(len(tri_is) // 3))
-        points = self.get_points()
-
-        def index_dot(index):
-            return np.dot(points[tri_is[3 * index]], vect)
-
-        indices.sort(key=index_dot)
-        for k in range(3):
-            tri_is[k::3] = tri_is[k::3][indices]
+        triangles = tri_is.reshape((-1, 3))
+        # Sum of the three vertices, i.e. the centroid scaled by 3
+        centroids = self.data.peek("points")[triangles].sum(1)
+        order = np.argsort(np.dot(centroids, vect), kind="stable")
+        tri_is[:] = triangles[order].flatten()
         return self
 
-    def always_sort_to_camera(self, camera: Camera):
-        self.add_updater(lambda m: m.sort_faces_back_to_front(
-            camera.get_location() - self.get_center()
-        ))
+    def always_sort_to_camera(self, camera: Camera, tolerance: float = 0):
+        """
+        With a positive tolerance, faces are only sorted again once the
+        direction to the camera has turned by more than that many radians
+        since the last sort, or if the points of the surface have changed.
+        """
+        last_sort = dict(vect=None, points_hash=None)
+
+        def sort_to_camera(surface):
+            vect = camera.get_location() - surface.get_center()
+            if tolerance > 0:
+                # Cached until the points are next written through data["points"]
+                points_hash = surface.data.get_array_hash("points")
+                unchanged = (
+                    last_sort["vect"] is not None
+                    and points_hash == last_sort["points_hash"]
+                    and angle_between_vectors(vect, last_sort["vect"]) < tolerance
+                )
+                if unchanged:
+                    return
+                last_sort["vect"] = vect
+                last_sort["points_hash"] = points_hash
+            surface.sort_faces_back_to_front(vect)
+
+        self.add_updater(sort_to_camera)
 
     # For shaders
     def get_shader_data(self) -> np.ndarray:
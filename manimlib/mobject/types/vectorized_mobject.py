@@ -27,6 +27,7 @@ from manimlib.utils.bezier import inverse_interpolate
 from manimlib.utils.bezier import partial_quadratic_bezier_points
 from manimlib.utils.color import color_gradient
 from manimlib.utils.color import rgb_to_hex
+from manimlib.utils.copy_on_write import CopyOnWriteDict
 from manimlib.utils.iterables import listify
 from manimlib.utils.iterables import make_even
 from manimlib.utils.iterables import resize_array
@@ -51,6 +52,8 @@ if TYPE_CHECKING:
 
 
 class VMobject(Mobject):
+    shader_buffer_attrs: tuple[str, ...] = ("fill_data", "stroke_data")
+
     CONFIG = {
         "fill_color": None,
         "fill_opacity": 0.0,
@@ -95,6 +98,9 @@ class VMobject(Mobject):
     def __init__(self, **kwargs):
         self.needs_new_triangulation = True
         self.triangulation = np.zeros(0, dtype='i4')
+        # Bumped by any edit which may change how the fill should be
+        # triangulated.  Affine maps like shift, scale and rotate leave it.
+        self.topology_version = 0
         super().__init__(**kwargs)
 
     def get_group_class(self):
@@ -185,7 +191,7 @@ class VMobject(Mobject):
     def align_stroke_width_data_to_points(self, recurse: bool = True) -> None:
         for mob in self.get_family(recurse):
             mob.data["stroke_width"] = resize_with_interpolation(
-                mob.data["stroke_width"], len(mob.get_points())
+                mob.data["stroke_width"], mob.get_num_points()
             )
 
     def set_style(
@@ -510,8 +516,22 @@ class VMobject(Mobject):
         return self
 
     def add_points_as_corners(self, points: Iterable[np.ndarray]):
-        for point in points:
-            self.add_line_to(point)
+        if self.long_lines:
+            for point in points:
+                self.add_line_to(point)
+            return points
+        # Same as calling add_line_to for each point, but all at once
+        corners = np.array(points, dtype=float).reshape((-1, self.dim))
+        if len(corners) == 0:
+            return points
+        starts = np.vstack([self.get_last_point(), corners[:-1]])
+        new_points = np.stack([
+            interpolate(starts, corners, a)
+            for a in np.linspace(0, 1, self.n_points_per_curve)
+        ], axis=1).reshape((-1, self.dim))
+        if self.has_new_path_started():
+            new_points = new_points[1:]
+        self.append_points(new_points)
         return points
 
     def set_points_as_corners(self, points: Iterable[np.ndarray]):
@@ -734,7 +754,7 @@ class VMobject(Mobject):
             return np.zeros(3)
 
         nppc = self.n_points_per_curve
-        points = self.get_points()
+        points = self.data.peek("points")
         p0 = points[0::nppc]
         p1 = points[nppc - 1::nppc]
 
@@ -773,6 +793,18 @@ class VMobject(Mobject):
     def reverse_points(self):
         super().reverse_points()
         self.refresh_unit_normal()
+        self.refresh_triangulation()
+        return self
+
+    def resize_points(self, new_length: int, *args, **kwargs):
+        if new_length != self.get_num_points():
+            self.refresh_triangulation(recurse=False)
+        super().resize_points(new_length, *args, **kwargs)
+        return self
+
+    def append_points(self, new_points: npt.ArrayLike):
+        super().append_points(new_points)
+        self.refresh_triangulation(recurse=False)
         return self
 
     # Alignment
@@ -871,10 +903,24 @@ class VMobject(Mobject):
     ):
         super().interpolate(mobject1, mobject2, alpha, *args, **kwargs)
         if self.has_fill():
-            tri1 = mobject1.get_triangulation()
-            tri2 = mobject2.get_triangulation()
-            if len(tri1) != len(tri1) or not np.all(tri1 == tri2):
-                self.refresh_triangulation()
+            # Whether the two triangulations agree only needs checking
+            # when one of them has changed since the last call
+            key = (
+                id(mobject1), mobject1.topology_version,
+                id(mobject2), mobject2.topology_version,
+            )
+            if key != getattr(self, "interpolation_key", None):
+                tri1 = mobject1.get_triangulation()
+                tri2 = mobject2.get_triangulation()
+                self.interpolation_key = key
+                self.interpolation_triangulation = None
+                if len(tri1) == len(tri2) and np.all(tri1 == tri2):
+                    self.interpolation_triangulation = tri1
+            if self.interpolation_triangulation is None:
+                self.refresh_triangulation(recurse=False)
+            else:
+                self.triangulation = self.interpolation_triangulation
+                self.needs_new_triangulation = False
         return self
 
     def pointwise_become_partial(self, vmobject: VMobject, a: float, b: float):
@@ -926,9 +972,10 @@ class VMobject(Mobject):
 
     # Related to triangulation
 
-    def refresh_triangulation(self):
-        for mob in self.get_family():
+    def refresh_triangulation(self, recurse: bool = True):
+        for mob in self.get_family(recurse):
             mob.needs_new_triangulation = True
+            mob.topology_version += 1
         return self
 
     def get_triangulation(self, normal_vector: np.ndarray | None = None):
@@ -941,7 +988,7 @@ class VMobject(Mobject):
         if not self.needs_new_triangulation:
             return self.triangulation
 
-        points = self.get_points()
+        points = self.data.peek("points")
 
         if len(points) <= 1:
             self.triangulation = np.zeros(0, dtype='i4')
@@ -990,23 +1037,38 @@ class VMobject(Mobject):
         return tri_indices
 
     def triggers_refreshed_triangulation(func):
+        # For methods which can move points arbitrarily.  Those which
+        # only apply an affine map, like shift, scale and rotate, go
+        # through apply_points_function and keep their triangulation.
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            old_points = self.get_points().copy()
-            func(self, *args, **kwargs)
-            if not np.all(self.get_points() == old_points):
-                self.refresh_unit_normal()
-                self.refresh_triangulation()
+            result = func(self, *args, **kwargs)
+            self.refresh_unit_normal()
+            self.refresh_triangulation()
+            return result
         return wrapper
 
-    @triggers_refreshed_triangulation
+    def has_same_points(self, points: npt.ArrayLike) -> bool:
+        # Restoring a state whose arrays are still shared can skip
+        # retriangulating
+        return points is self.data.peek("points")
+
     def set_points(self, points: npt.ArrayLike):
+        unchanged = self.has_same_points(points)
         super().set_points(points)
+        if not unchanged:
+            self.refresh_unit_normal()
+            self.refresh_triangulation()
         return self
 
-    @triggers_refreshed_triangulation
     def set_data(self, data: dict):
+        unchanged = "points" not in data or self.has_same_points(
+            data.peek("points") if isinstance(data, CopyOnWriteDict) else data["points"]
+        )
         super().set_data(data)
+        if not unchanged:
+            self.refresh_unit_normal()
+            self.refresh_triangulation()
         return self
 
     # TODO, how to be smart about tangents here?
@@ -1098,7 +1160,7 @@ class VMobject(Mobject):
         return result
 
     def get_stroke_shader_data(self) -> np.ndarray:
-        points = self.get_points()
+        points = self.data.peek("points")
         if len(self.stroke_data) != len(points):
             self.stroke_data = resize_array(self.stroke_data, len(points))
 
@@ -1117,7 +1179,7 @@ class VMobject(Mobject):
         return self.stroke_data
 
     def get_fill_shader_data(self) -> np.ndarray:
-        points = self.get_points()
+        points = self.data.peek("points")
         if len(self.fill_data) != len(points):
             self.fill_data = resize_array(self.fill_data, len(points))
             self.fill_data["vert_index"][:, 0] = range(len(points))
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import itertools as it
 
+import moderngl
 import numpy as np
 
 from manimlib.constants import FRAME_HEIGHT, FRAME_WIDTH
+from manimlib.constants import ORIGIN
 from manimlib.constants import WHITE
 from manimlib.animation.composition import AnimationGroup
 from manimlib.animation.indication import VShowPassingFlash
 from manimlib.mobject.geometry import Arrow
+from manimlib.mobject.types.point_cloud_mobject import PMobject
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.bezier import interpolate
@@ -118,6 +121,28 @@ def get_sample_points_from_coordinate_system(
     return it.product(*ranges)
 
 
+def get_vector_field_outputs(
+    func: Callable[..., Sequence[float]],
+    coordinate_system: CoordinateSystem,
+    points: np.ndarray,
+    batch_func: bool = False
+) -> np.ndarray:
+    """
+    Returns the output of func at each point, one row per point.  With
+    batch_func, func is first called once on arrays of coordinates for all
+    points, and should return a sequence of arrays, one per output coordinate.
+    """
+    cs = coordinate_system
+    if batch_func and len(points) > 0:
+        try:
+            outputs = np.array(func(*cs.p2c(points)), dtype=float)
+        except (TypeError, ValueError):
+            outputs = None
+        if outputs is not None and outputs.ndim == 2 and outputs.shape[1] == len(points):
+            return outputs.T
+    return np.array([func(*cs.p2c(point)) for point in points], dtype=float)
+
+
 # Mobjects
 
 class VectorField(VGroup):
@@ -176,6 +201,132 @@ class VectorField(VGroup):
         return vect
 
 
+class ArrowField(PMobject):
+    """
+    Like VectorField, but all vectors live in a single mobject, as arrays of
+    base points, vectors and colors, and are drawn with one shader which
+    builds each arrow in a geometry shader.  To follow a func which changes
+    over time, call update_vectors in an updater.
+    """
+    CONFIG = {
+        "step_multiple": 0.5,
+        "magnitude_range": (0, 2),
+        "color_map": "3b1b_colormap",
+        # Takes in actual norm, spits out displayed norm
+        "length_func": lambda norm: 0.45 * sigmoid(norm),
+        "opacity": 1.0,
+        # See StreamLines
+        "batch_func": False,
+        # These match the look of the default Arrow
+        "arrow_width": 0.05,
+        "tip_width_ratio": 4,
+        "tip_length": 0.15,
+        "max_tip_length_to_length_ratio": 0.3,
+        "shader_folder": "arrow_field",
+        "render_primitive": moderngl.POINTS,
+        "shader_dtype": [
+            ('point', np.float32, (3,)),
+            ('vect', np.float32, (3,)),
+            ('color', np.float32, (4,)),
+        ],
+    }
+
+    def __init__(
+        self,
+        func: Callable[[float, float], Sequence[float]],
+        coordinate_system: CoordinateSystem,
+        **kwargs
+    ):
+        self.func = func
+        self.coordinate_system = coordinate_system
+        super().__init__(**kwargs)
+
+    def init_data(self) -> None:
+        super().init_data()
+        self.data["vects"] = np.zeros((0, 3))
+
+    def init_uniforms(self) -> None:
+        super().init_uniforms()
+        self.uniforms["arrow_width"] = self.arrow_width
+        self.uniforms["tip_width"] = self.tip_width_ratio * self.arrow_width
+        self.uniforms["tip_length"] = self.tip_length
+        self.uniforms["max_tip_length_to_length_ratio"] = self.max_tip_length_to_length_ratio
+
+    def init_points(self) -> None:
+        cs = self.coordinate_system
+        sample_coords = np.array(list(get_sample_points_from_coordinate_system(
+            cs, self.step_multiple
+        )))
+        self.set_points(cs.c2p(*sample_coords.T))
+
+    def init_colors(self) -> None:
+        super().init_colors()
+        self.update_vectors()
+
+    def get_displayed_norms(self, norms: np.ndarray) -> np.ndarray:
+        try:
+            result = np.array(self.length_func(norms), dtype=float)
+        except (TypeError, ValueError):
+            result = None
+        if result is None or result.shape != norms.shape:
+            result = np.array([self.length_func(norm) for norm in norms], dtype=float)
+        return result
+
+    def update_vectors(self):
+        """
+        Evaluates func at each base point, and resets the
+        vectors and their colors to match
+        """
+        cs = self.coordinate_system
+        points = self.get_points()
+        outputs = get_vector_field_outputs(
+            self.func, cs, points, self.batch_func
+        )
+        norms = np.sqrt((outputs**2).sum(1))
+        ratios = np.zeros_like(norms)
+        nonzero = norms > 0
+        ratios[nonzero] = self.get_displayed_norms(norms[nonzero]) / norms[nonzero]
+        outputs *= ratios[:, np.newaxis]
+
+        values_to_rgbs = get_vectorized_rgb_gradient_function(
+            *self.magnitude_range, self.color_map,
+        )
+        self.data["vects"] = cs.c2p(*outputs.T) - cs.get_origin()
+        self.data["rgbas"][:, :3] = values_to_rgbs(norms)
+        self.data["rgbas"][:, 3] = self.opacity
+        return self
+
+    def get_vects(self) -> np.ndarray:
+        return self.data["vects"]
+
+    def apply_points_function(
+        self,
+        func: Callable[[np.ndarray], np.ndarray],
+        about_point: np.ndarray = None,
+        about_edge: np.ndarray = ORIGIN,
+        works_on_bounding_box: bool = False
+    ):
+        # Tips of the vectors are carried along with their base points
+        if about_point is None and about_edge is not None:
+            about_point = self.get_bounding_box_point(about_edge)
+        tips = self.get_points() + self.get_vects()
+        super().apply_points_function(
+            func, about_point, None, works_on_bounding_box
+        )
+        if about_point is not None:
+            tips = func(tips - about_point) + about_point
+        else:
+            tips = func(tips)
+        self.data["vects"] = tips - self.get_points()
+        return self
+
+    def get_shader_data(self) -> np.ndarray:
+        shader_data = super().get_shader_data()
+        self.read_data_to_shader(shader_data, "vect", "vects")
+        self.read_data_to_shader(shader_data, "color", "rgbas")
+        return shader_data
+
+
 class StreamLines(VGroup):
     CONFIG = {
         "step_multiple": 0.5,
@@ -187,6 +338,13 @@ class StreamLines(VGroup):
         "max_time_steps": 200,
         "n_samples_per_line": 10,
         "cutoff_norm": 15,
+        # Either "euler" or "rk4"
+        "integration_method": "euler",
+        # If True, func is first called on arrays of coordinates for all
+        # points at once, and should return a sequence of arrays, one per
+        # output coordinate.  If that call fails, it falls back to calling
+        # func once per point
+        "batch_func": False,
         # Style info
         "stroke_width": 1,
         "stroke_color": WHITE,
@@ -214,25 +372,59 @@ class StreamLines(VGroup):
         out_coords = self.func(*in_coords)
         return self.coordinate_system.c2p(*out_coords)
 
+    def get_func_outputs(self, points: np.ndarray) -> np.ndarray:
+        return get_vector_field_outputs(
+            self.func, self.coordinate_system, points, self.batch_func
+        )
+
+    def get_velocities(self, points: np.ndarray) -> np.ndarray:
+        cs = self.coordinate_system
+        outputs = self.get_func_outputs(points)
+        return cs.c2p(*outputs.T) - cs.get_origin()
+
+    def get_next_points(self, points: np.ndarray) -> np.ndarray:
+        dt = self.dt
+        if self.integration_method == "euler":
+            return points + dt * self.get_velocities(points)
+        if self.integration_method == "rk4":
+            k1 = self.get_velocities(points)
+            k2 = self.get_velocities(points + 0.5 * dt * k1)
+            k3 = self.get_velocities(points + 0.5 * dt * k2)
+            k4 = self.get_velocities(points + dt * k3)
+            return points + (dt / 6) * (k1 + 2 * k2 + 2 * k3 + k4)
+        raise Exception(f"Unknown integration method {self.integration_method}")
+
     def draw_lines(self) -> None:
+        # All lines are advanced together, with those which have
+        # passed cutoff_norm or arc_len dropping out along the way
+        start_points = self.get_start_points()
+        n_lines = len(start_points)
+        all_points = np.zeros((self.max_time_steps + 1, n_lines, 3))
+        all_points[0] = start_points
+        line_lengths = np.full(n_lines, self.max_time_steps + 1)
+        arc_lens = np.zeros(n_lines)
+        active = np.arange(n_lines)
+        for n in range(self.max_time_steps):
+            if len(active) == 0:
+                break
+            last_points = all_points[n, active]
+            new_points = self.get_next_points(last_points)
+            all_points[n + 1, active] = new_points
+            arc_lens[active] += np.sqrt(((new_points - last_points)**2).sum(1))
+            done = np.logical_or(
+                np.sqrt((last_points**2).sum(1)) > self.cutoff_norm,
+                arc_lens[active] > self.arc_len,
+            )
+            line_lengths[active[done]] = n + 2
+            active = active[~done]
+
+        # Copying is much cheaper than initializing a new VMobject each time
+        template = VMobject()
         lines = []
-        origin = self.coordinate_system.get_origin()
-        for point in self.get_start_points():
-            points = [point]
-            total_arc_len = 0
-            time = 0
-            for x in range(self.max_time_steps):
-                time += self.dt
-                last_point = points[-1]
-                new_point = last_point + self.dt * (self.point_func(last_point) - origin)
-                points.append(new_point)
-                total_arc_len += get_norm(new_point - last_point)
-                if get_norm(last_point) > self.cutoff_norm:
-                    break
-                if total_arc_len > self.arc_len:
-                    break
-            line = VMobject()
-            line.virtual_time = time
+        for index, length in enumerate(line_lengths):
+            points = all_points[:length, index]
+            line = template.copy()
+            line.virtual_time = (length - 1) * self.dt
             step = max(1, int(len(points) / self.n_samples_per_line))
             line.set_points_as_corners(points[::step])
             line.make_approximately_smooth()
@@ -249,28 +441,27 @@ class StreamLines(VGroup):
         if noise_factor is None:
             noise_factor = cs.x_range[2] * self.step_multiple * 0.5
 
-        return np.array([
-            cs.c2p(*coords) + noise_factor * np.random.random(3)
-            for n in range(self.n_repeats)
-            for coords in sample_coords
-        ])
+        sample_coords = np.array(list(sample_coords))
+        points = cs.c2p(*np.tile(sample_coords, (self.n_repeats, 1)).T)
+        return points + noise_factor * np.random.random(points.shape)
 
     def init_style(self) -> None:
         if self.color_by_magnitude:
             values_to_rgbs = get_vectorized_rgb_gradient_function(
                 *self.magnitude_range, self.color_map,
             )
-            cs = self.coordinate_system
-            for line in self.submobjects:
-                norms = [
-                    get_norm(self.func(*cs.p2c(point)))
-                    for point in line.get_points()
-                ]
-                rgbs = values_to_rgbs(norms)
+            lines = self.submobjects
+            if lines:
+                outputs = self.get_func_outputs(
+                    np.vstack([line.get_points() for line in lines])
+                )
+                rgbs = values_to_rgbs(np.sqrt((outputs**2).sum(1)))
                 rgbas = np.zeros((len(rgbs), 4))
                 rgbas[:, :3] = rgbs
                 rgbas[:, 3] = self.stroke_opacity
-                line.set_rgba_array(rgbas, "stroke_rgba")
+                ends = np.cumsum([line.get_num_points() for line in lines])
+                for line, line_rgbas in zip(lines, np.split(rgbas, ends[:-1])):
+                    line.set_rgba_array(line_rgbas, "stroke_rgba")
         else:
             self.set_stroke(self.stroke_color, opacity=self.stroke_opacity)
 
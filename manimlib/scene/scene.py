@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from collections import OrderedDict
 from functools import wraps
 import inspect
+import multiprocessing as mp
 import os
 import platform
 import pyperclip
@@ -12,6 +12,7 @@ import time
 import numpy as np
 from tqdm import tqdm as ProgressDisplay
 
+from manimlib import __version__
 from manimlib.animation.animation import prepare_animation
 from manimlib.camera.camera import Camera
 from manimlib.constants import ARROW_SYMBOLS
@@ -25,18 +26,27 @@ from manimlib.mobject.mobject import _AnimationBuilder
 from manimlib.mobject.mobject import Group
 from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.mobject import Point
+from manimlib.mobject.svg.tex_mobject import Tex
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.scene.scene_file_writer import SceneFileWriter
+from manimlib.utils.color import color_to_rgb
+from manimlib.utils.color import rgb_to_hex
 from manimlib.utils.config_ops import digest_config
 from manimlib.utils.family_ops import extract_mobject_family_members
+from manimlib.utils.hashing import IncompleteHashError
+from manimlib.utils.hashing import get_content_hash
 from manimlib.utils.iterables import list_difference_update
+from manimlib.utils.tex_file_writing import compile_pending_tex
+from manimlib.utils.tex_file_writing import set_tex_compile_workers
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Callable, Iterable
 
+    from multiprocessing.connection import Connection
+
     from PIL.Image import Image
 
     from manimlib.animation.animation import Animation
@@ -66,6 +76,14 @@ class Scene(object):
         "show_animation_progress": False,
         "pan_sensitivity": 3,
         "max_num_saved_states": 50,
+        # Oldest saved states are dropped once the data they hold
+        # exceeds this many megabytes.  None means no limit.
+        "max_saved_states_mb": 512,
+        # When writing to a movie, plays can be divided into contiguous ranges
+        # which are rendered by this many separate processes, given the total
+        # number of plays in num_plays_hint
+        "n_workers": 1,
+        "num_plays_hint": None,
     }
 
     def __init__(self, **kwargs):
@@ -87,6 +105,8 @@ class Scene(object):
         self.num_plays: int = 0
         self.time: float = 0
         self.skip_time: float = 0
+        # Arguments of each call to add_sound which wasn't skipped
+        self.added_sounds: list[tuple] = []
         self.original_skipping_status: bool = self.skip_animations
         self.checkpoint_states: dict[str, list[tuple[Mobject, Mobject]]] = dict()
 
@@ -101,6 +121,8 @@ class Scene(object):
         self.hold_on_wait = self.presenter_mode
         self.inside_embed = False
         self.quit_interaction = False
+        # Set while stepping through a play whose frames were cached
+        self.skip_frame_rendering = False
 
         # Much nicer to work with deterministic scenes
         if self.random_seed is not None:
@@ -111,6 +133,9 @@ class Scene(object):
         return self.__class__.__name__
 
     def run(self) -> None:
+        if self.should_run_in_workers():
+            self.run_in_workers()
+            return
         self.virtual_animation_start_time: float = 0
         self.real_animation_start_time: float = time.time()
         self.file_writer.begin()
@@ -127,6 +152,128 @@ class Scene(object):
             self.file_writer.ended_with_interrupt = True
         self.tear_down()
 
+    def should_run_in_workers(self) -> bool:
+        if self.n_workers <= 1 or not self.file_writer.write_to_movie:
+            return False
+        if self.num_plays_hint is None:
+            log.warning("Number of plays is unknown, so rendering with a single process")
+            return False
+        if not self.file_writer.break_into_partial_movies:
+            log.warning("Rendering with workers requires break_into_partial_movies")
+            return False
+        return True
+
+    def get_worker_ranges(self) -> list[tuple[int, int]]:
+        start = self.start_at_animation_number or 0
+        end = self.num_plays_hint
+        if self.end_at_animation_number is not None:
+            end = min(end, self.end_at_animation_number)
+        n_workers = max(min(self.n_workers, end - start), 1)
+        bounds = np.linspace(start, end, n_workers + 1).astype(int)
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def get_worker_config(self, start: int, end: int | None) -> dict:
+        file_writer_config = dict(self.file_writer_config)
+        file_writer_config.update({
+            # Partial movies from all workers go in the same directory
+            "file_name": self.file_writer.get_scene_name(),
+            "combine_partial_movies": False,
+            "save_last_frame": False,
+            "open_file_upon_completion": False,
+            "show_file_location_upon_completion": False,
+            "total_frames": 0,
+            "quiet": True,
+        })
+        camera_config = dict(self.camera_config)
+        if "background_color" in camera_config:
+            # Color objects don't pickle, but their hex codes do
+            camera_config["background_color"] = rgb_to_hex(
+                color_to_rgb(camera_config["background_color"])
+            )
+        return {
+            "camera_config": camera_config,
+            "file_writer_config": file_writer_config,
+            "skip_animations": self.original_skipping_status,
+            # The first worker starts like a normal run, so that
+            # anything before the first play, like sounds, is kept
+            "start_at_animation_number": int(start) or None,
+            "end_at_animation_number": None if end is None else int(end),
+            "leave_progress_bars": self.leave_progress_bars,
+            "show_animation_progress": self.show_animation_progress,
+            "preview": False,
+            "presenter_mode": False,
+            "n_workers": 1,
+        }
+
+    def run_in_workers(self) -> None:
+        """
+        Each worker fast-forwards through the scene to its own range of plays,
+        writing only the partial movie files for those, which are then combined
+        here as usual.
+        """
+        from manimlib.config import __config_file__
+
+        ranges = self.get_worker_ranges()
+        log.info(f"Rendering {self} with {len(ranges)} workers")
+        # Spawned rather than forked, so that none inherit this process's gl context
+        mp_context = mp.get_context("spawn")
+        processes = []
+        connections = []
+        for index, (start, end) in enumerate(ranges):
+            if index == len(ranges) - 1:
+                # num_plays_hint may be out of date, so the last worker
+                # carries on to the end of the scene, wherever that is
+                end = self.end_at_animation_number
+            # Workers send back what the final movie needs from their plays
+            receiver, sender = mp_context.Pipe(duplex=False)
+            process = mp_context.Process(
+                target=render_scene_in_worker,
+                args=(
+                    self.file_writer.input_file_path,
+                    str(self),
+                    self.get_worker_config(start, end),
+                    __config_file__,
+                    len(ranges),
+                    sender,
+                ),
+            )
+            process.start()
+            sender.close()
+            processes.append(process)
+            connections.append(receiver)
+
+        failed = False
+        sounds = []
+        expected_num_plays = num_plays = ranges[-1][1]
+        # Times in each worker are shifted by the length of the
+        # movies rendered before its range
+        offset = 0
+        for process, receiver, (start, end) in zip(processes, connections, ranges):
+            try:
+                worker_sounds, duration, num_plays = receiver.recv()
+                for sound_file, time, gain, gain_to_background in worker_sounds:
+                    sounds.append((sound_file, offset + time, gain, gain_to_background))
+                offset += duration
+            except EOFError:
+                # The worker exited without sending anything
+                pass
+            process.join()
+            if process.exitcode != 0:
+                log.error(f"Worker rendering plays {start} to {end} of {self} failed")
+                failed = True
+        if failed:
+            return
+        if num_plays != expected_num_plays:
+            log.warning(
+                f"{self} rendered {num_plays} plays, but was expected to have "
+                f"{expected_num_plays}, so its workers were unevenly loaded"
+            )
+        for sound in sounds:
+            self.file_writer.add_sound(*sound)
+        # As counted by the last worker
+        self.num_plays = num_plays
+        self.file_writer.finish()
+
     def setup(self) -> None:
         """
         This is meant to be implement by any scenes which
@@ -143,10 +290,29 @@ class Scene(object):
     def tear_down(self) -> None:
         self.stop_skipping()
         self.file_writer.finish()
+        if self.should_save_timeline():
+            self.file_writer.save_timeline(self.get_timeline())
         if self.window:
             self.window.destroy()
             self.window = None
 
+    def get_timeline(self) -> dict[str, float]:
+        return {
+            "duration": self.time - self.skip_time,
+            "num_plays": self.num_plays,
+        }
+
+    def should_save_timeline(self) -> bool:
+        # Not when time was spent interacting, or when this only
+        # covers part of a scene being rendered by workers
+        fw = self.file_writer
+        return all([
+            self.window is None,
+            not fw.ended_with_interrupt,
+            fw.combine_partial_movies,
+            fw.write_to_movie or fw.save_last_frame,
+        ])
+
     def interact(self) -> None:
         # If there is a window, enter a loop
         # which updates the frame while under
@@ -265,6 +431,8 @@ class Scene(object):
         self.update_mobjects(dt)
         if self.skip_animations and not ignore_skipping:
             return
+        if self.skip_frame_rendering:
+            return
 
         if self.is_window_closing():
             raise EndScene()
@@ -282,7 +450,7 @@ class Scene(object):
                 self.update_frame(0)
 
     def emit_frame(self) -> None:
-        if not self.skip_animations:
+        if not self.skip_animations and not self.skip_frame_rendering:
             self.file_writer.write_frame(self.camera)
 
     # Related to updating
@@ -532,6 +700,20 @@ class Scene(object):
 
             self.update_skipping_status()
             should_write = not self.skip_animations
+            cache_key = None
+            use_cache = False
+            if should_write and self.file_writer.is_caching_partial_movies():
+                try:
+                    cache_key = self.get_partial_movie_cache_key(func, args, kwargs)
+                    use_cache = self.file_writer.has_cached_partial_movie(cache_key)
+                except IncompleteHashError as err:
+                    # Better to render again than risk reusing the wrong movie
+                    log.debug(f"Not caching play {self.num_plays}: {err}")
+            if use_cache:
+                # Step through the same times as a render would, so the scene
+                # ends up in the same state, but without drawing any frames
+                self.skip_frame_rendering = True
+                should_write = False
             if should_write:
                 self.file_writer.begin_animation()
 
@@ -543,7 +725,10 @@ class Scene(object):
             func(self, *args, **kwargs)
 
             if should_write:
-                self.file_writer.end_animation()
+                self.file_writer.end_animation(cache_key)
+            if use_cache:
+                self.skip_frame_rendering = False
+                self.file_writer.use_cached_partial_movie(cache_key)
 
             if self.inside_embed:
                 self.save_state()
@@ -558,6 +743,34 @@ class Scene(object):
     def refresh_static_mobjects(self) -> None:
         self.camera.refresh_static_mobjects()
 
+    def get_partial_movie_cache_key(self, func: Callable, args: tuple, kwargs: dict) -> str:
+        """
+        Hash of everything which determines the frames of a play or wait call,
+        namely the call itself, the current state of the scene, and the
+        settings for rendering.  Raises an IncompleteHashError if any of
+        these can't be fully described.
+        """
+        camera = self.camera
+        return get_content_hash(
+            __version__,
+            func.__name__, args, kwargs,
+            self.time,
+            self.mobjects,
+            random.getstate(),
+            np.random.get_state(),
+            camera.get_pixel_shape(),
+            camera.fps,
+            camera.background_rgba,
+            camera.samples,
+            camera.anti_alias_width,
+            self.file_writer.movie_file_extension,
+            max_depth=10,
+            strict=True,
+            # Functions often refer to the scene, whose state
+            # that matters is already covered above
+            opaque=[self],
+        )
+
     def begin_animations(self, animations: Iterable[Animation]) -> None:
         for animation in animations:
             animation.begin()
@@ -658,8 +871,28 @@ class Scene(object):
         if self.skip_animations:
             return
         time = self.get_time() + time_offset
+        self.added_sounds.append((sound_file, time, gain, gain_to_background))
         self.file_writer.add_sound(sound_file, time, gain, gain_to_background)
 
+    def prefetch_tex(
+        self,
+        *tex_strings: str | tuple[str, ...],
+        tex_class: type = Tex,
+        **kwargs
+    ) -> None:
+        """
+        Starts compiling the tex for tex_class(tex_string, **kwargs) for each
+        of the tex_strings, all at once and in the background, so that later
+        constructing those mobjects needn't wait on a compile for each.
+        Tuples are passed as several strings, e.g. for Tex("a", "=", "b").
+        """
+        for tex_string in tex_strings:
+            if isinstance(tex_string, tuple):
+                tex_class.queue(*tex_string, **kwargs)
+            else:
+                tex_class.queue(tex_string, **kwargs)
+        compile_pending_tex()
+
     # Helpers for interactive development
 
     def get_state(self) -> SceneState:
@@ -676,8 +909,30 @@ class Scene(object):
             return
         self.redo_stack = []
         self.undo_stack.append(state)
-        if len(self.undo_stack) > self.max_num_saved_states:
-            self.undo_stack.pop(0)
+        self.trim_undo_stack()
+
+    def trim_undo_stack(self) -> None:
+        stack = self.undo_stack
+        if len(stack) > self.max_num_saved_states:
+            del stack[:len(stack) - self.max_num_saved_states]
+        if self.max_saved_states_mb is None:
+            return
+        # Snapshots are shared between states, so each is only counted
+        # once, and only freed once no remaining state refers to it
+        ref_counts = dict()
+        nbytes = 0
+        for state in stack:
+            for snapshot in state.get_snapshots():
+                if id(snapshot) not in ref_counts:
+                    ref_counts[id(snapshot)] = 0
+                    nbytes += snapshot.nbytes
+                ref_counts[id(snapshot)] += 1
+        max_bytes = self.max_saved_states_mb * 1024 * 1024
+        while len(stack) > 1 and nbytes > max_bytes:
+            for snapshot in stack.pop(0).get_snapshots():
+                ref_counts[id(snapshot)] -= 1
+                if ref_counts[id(snapshot)] == 0:
+                    nbytes -= snapshot.nbytes
 
     def undo(self):
         if self.undo_stack:
@@ -862,49 +1117,148 @@ class Scene(object):
         pass
 
 
+class MobjectSnapshot(object):
+    """
+    Records the data, uniforms and submobjects of a single mobject, without
+    the data of those submobjects, which get their own snapshots.  Data
+    arrays are shared with the mobject until one side changes them.
+    """
+    def __init__(self, mobject: Mobject):
+        self.data = mobject.data.copy()
+        self.uniforms = {
+            key: np.array(value)
+            for key, value in mobject.uniforms.items()
+        }
+        self.submobjects = list(mobject.submobjects)
+        self.shader_folder = mobject.shader_folder
+        self.texture_paths = mobject.texture_paths
+        self.depth_test = mobject.depth_test
+        self.render_primitive = mobject.render_primitive
+        self.nbytes = sum(array.nbytes for array in self.data.values())
+
+    def matches(self, mobject: Mobject | MobjectSnapshot) -> bool:
+        if self.submobjects != mobject.submobjects:
+            return False
+        if self.data.get_fingerprint() != mobject.data.get_fingerprint():
+            return False
+        if self.uniforms.keys() != mobject.uniforms.keys():
+            return False
+        if not all(
+            np.array_equal(value, mobject.uniforms[key])
+            for key, value in self.uniforms.items()
+        ):
+            return False
+        return all(
+            getattr(self, attr) == getattr(mobject, attr)
+            for attr in ["shader_folder", "texture_paths", "depth_test", "render_primitive"]
+        )
+
+    def restore(self, mobject: Mobject) -> None:
+        mobject.set_data(self.data)
+        mobject.set_uniforms(self.uniforms)
+        mobject.shader_folder = self.shader_folder
+        mobject.texture_paths = self.texture_paths
+        mobject.depth_test = self.depth_test
+        mobject.render_primitive = self.render_primitive
+
+
 class SceneState():
     def __init__(self, scene: Scene, ignore: list[Mobject] | None = None):
         self.time = scene.time
         self.num_plays = scene.num_plays
-        self.mobjects_to_copies = OrderedDict.fromkeys(scene.mobjects)
+        self.mobjects = list(scene.mobjects)
         if ignore:
-            for mob in ignore:
-                self.mobjects_to_copies.pop(mob, None)
-
-        last_m2c = scene.undo_stack[-1].mobjects_to_copies if scene.undo_stack else dict()
-        for mob in self.mobjects_to_copies:
-            # If it hasn't changed since the last state, just point to the
-            # same copy as before
-            if mob in last_m2c and last_m2c[mob].looks_identical(mob):
-                self.mobjects_to_copies[mob] = last_m2c[mob]
-            else:
-                self.mobjects_to_copies[mob] = mob.copy()
+            self.mobjects = [mob for mob in self.mobjects if mob not in ignore]
+
+        # Family members which haven't changed since the last state
+        # just point to the same snapshot as before
+        undo_stack = getattr(scene, "undo_stack", None)
+        last_snapshots = undo_stack[-1].snapshots if undo_stack else dict()
+        self.snapshots: dict[Mobject, MobjectSnapshot] = dict()
+        for mob in extract_mobject_family_members(self.mobjects):
+            if mob in self.snapshots:
+                continue
+            snapshot = last_snapshots.get(mob)
+            if snapshot is None or not snapshot.matches(mob):
+                snapshot = MobjectSnapshot(mob)
+            self.snapshots[mob] = snapshot
 
     def __eq__(self, state: SceneState):
         return all((
             self.time == state.time,
             self.num_plays == state.num_plays,
-            self.mobjects_to_copies == state.mobjects_to_copies
+            self.mobjects_match(state),
         ))
 
+    def get_snapshots(self) -> Iterable[MobjectSnapshot]:
+        return self.snapshots.values()
+
     def mobjects_match(self, state: SceneState):
-        return self.mobjects_to_copies == state.mobjects_to_copies
+        return self.mobjects == state.mobjects and self.snapshots == state.snapshots
 
     def n_changes(self, state: SceneState):
-        m2c = state.mobjects_to_copies
-        return sum(
-            1 - int(mob in m2c and mob.looks_identical(m2c[mob]))
-            for mob in self.mobjects_to_copies
-        )
+        def has_changed(mob):
+            to_check = [mob]
+            while to_check:
+                sm = to_check.pop()
+                snapshot = self.snapshots[sm]
+                other = state.snapshots.get(sm)
+                if other is None:
+                    return True
+                if snapshot is not other and not snapshot.matches(other):
+                    return True
+                to_check.extend(snapshot.submobjects)
+            return False
+
+        return sum(map(has_changed, self.mobjects))
 
     def restore_scene(self, scene: Scene):
         scene.time = self.time
         scene.num_plays = self.num_plays
-        scene.mobjects = [
-            mob.become(mob_copy)
-            for mob, mob_copy in self.mobjects_to_copies.items()
-        ]
+        for mob, snapshot in self.snapshots.items():
+            snapshot.restore(mob)
+        # Rebuild families from the bottom up
+        for mob, snapshot in reversed(self.snapshots.items()):
+            if mob.submobjects != snapshot.submobjects:
+                mob.set_submobjects(snapshot.submobjects)
+        for mob in self.mobjects:
+            mob.refresh_bounding_box(recurse_down=True)
+        scene.mobjects = list(self.mobjects)
 
 
 class EndScene(Exception):
     pass
+
+
+def render_scene_in_worker(
+    file_path: str,
+    scene_name: str,
+    scene_config: dict,
+    config_file: str,
+    n_workers: int,
+    result_connection: Connection
+) -> None:
+    # Spawning this worker already imported manimlib, so the
+    # config file is set here before any configuration is read,
+    # and anything cached from the default one is dropped
+    import manimlib.config
+    from manimlib.utils.customization import CUSTOMIZATION
+    manimlib.config.__config_file__ = config_file
+    CUSTOMIZATION.clear()
+    # Workers share the machine, so each only compiles
+    # its share of tex expressions at once
+    set_tex_compile_workers((os.cpu_count() or 1) // n_workers)
+
+    module = manimlib.config.get_module(file_path)
+    scene = getattr(module, scene_name)(**scene_config)
+    scene.run()
+    # Times are sent relative to the start of this worker's movies
+    result_connection.send((
+        [
+            (sound_file, time - scene.skip_time, gain, gain_to_background)
+            for sound_file, time, gain, gain_to_background in scene.added_sounds
+        ],
+        scene.time - scene.skip_time,
+        scene.num_plays,
+    ))
+    result_connection.close()
@@ -1,22 +1,31 @@
 from __future__ import annotations
 
+import json
 import os
 import platform
+import queue
 import shutil
 import subprocess as sp
 import sys
+import threading
+import time
 
 import numpy as np
 from pydub import AudioSegment
 from tqdm import tqdm as ProgressDisplay
 
+from manimlib import __version__
 from manimlib.constants import FFMPEG_BIN
 from manimlib.logger import log
 from manimlib.mobject.mobject import Mobject
 from manimlib.utils.config_ops import digest_config
+from manimlib.utils.directories import get_scene_timeline_dir
 from manimlib.utils.file_ops import add_extension_if_not_present
 from manimlib.utils.file_ops import get_sorted_integer_files
 from manimlib.utils.file_ops import guarantee_existence
+from manimlib.utils.hashing import get_content_hash
+from manimlib.utils.hashing import get_file_hash
+from manimlib.utils.hashing import get_source_file_hashes
 from manimlib.utils.sounds import get_full_sound_file_path
 
 from typing import TYPE_CHECKING
@@ -32,6 +41,14 @@ class SceneFileWriter(object):
     CONFIG = {
         "write_to_movie": False,
         "break_into_partial_movies": False,
+        # Set to False if some other process, e.g. one which started this
+        # scene as a worker, will combine the partial movie files
+        "combine_partial_movies": True,
+        # When breaking into partial movies, reuse those from earlier renders
+        # whose plays had identical animations, mobjects, camera and render
+        # settings, keeping at most this many megabytes of them around
+        "cache_partial_movies": True,
+        "partial_movie_cache_max_mb": 1024,
         # TODO, save_pngs is doing nothing
         "save_pngs": False,
         "png_mode": "RGBA",
@@ -47,21 +64,26 @@ class SceneFileWriter(object):
         "quiet": False,
         "total_frames": 0,
         "progress_description_len": 60,
+        # If positive, frames are handed to ffmpeg from a background thread,
+        # with at most this many frames waiting in between
+        "frame_queue_size": 0,
     }
 
     def __init__(self, scene, **kwargs):
         digest_config(self, kwargs)
         self.scene: Scene = scene
         self.writing_process: sp.Popen | None = None
+        self.writer_thread: threading.Thread | None = None
         self.has_progress_display: bool = False
         self.ended_with_interrupt: bool = False
         self.init_output_directories()
         self.init_audio()
+        self.init_frame_queue_stats()
 
     # Output directories and files
     def init_output_directories(self) -> None:
         out_dir = self.output_directory or ""
-        scene_name = self.file_name or self.get_default_scene_name()
+        scene_name = self.get_scene_name()
         if self.save_last_frame:
             image_dir = guarantee_existence(os.path.join(out_dir, "images"))
             image_file = add_extension_if_not_present(scene_name, ".png")
@@ -74,6 +96,8 @@ class SceneFileWriter(object):
                 self.partial_movie_directory = guarantee_existence(os.path.join(
                     movie_dir, "partial_movie_files", scene_name,
                 ))
+                if self.cache_partial_movies:
+                    self.init_partial_movie_cache()
         # A place to save mobjects
         self.saved_mobject_directory = os.path.join(
             out_dir, "mobjects", str(self.scene)
@@ -85,6 +109,9 @@ class SceneFileWriter(object):
             path = path[1:]
         return path
 
+    def get_scene_name(self) -> str:
+        return self.file_name or self.get_default_scene_name()
+
     def get_default_scene_name(self) -> str:
         name = str(self.scene)
         saan = self.scene.start_at_animation_number
@@ -119,6 +146,121 @@ class SceneFileWriter(object):
     def get_movie_file_path(self) -> str:
         return self.movie_file_path
 
+    # Caching partial movies
+    def init_partial_movie_cache(self) -> None:
+        self.partial_movie_cache_directory = guarantee_existence(os.path.join(
+            self.partial_movie_directory, "cache"
+        ))
+        self.partial_movie_cache_index_path = os.path.join(
+            self.partial_movie_cache_directory, "index.json"
+        )
+        self.partial_movie_cache_index = self.read_partial_movie_cache_index()
+
+    def is_caching_partial_movies(self) -> bool:
+        return all([
+            self.write_to_movie,
+            self.break_into_partial_movies,
+            self.cache_partial_movies,
+        ])
+
+    def get_cached_partial_movie_path(self, key: str) -> str:
+        return os.path.join(
+            self.partial_movie_cache_directory,
+            key + self.movie_file_extension,
+        )
+
+    def read_partial_movie_cache_index(self) -> dict[str, dict[str, float]]:
+        # Maps keys to the size and last time of use of their movie
+        try:
+            with open(self.partial_movie_cache_index_path, "r") as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return dict()
+
+    def write_partial_movie_cache_index(self) -> None:
+        # Other processes, e.g. parallel workers, may share this cache, so
+        # merge with what's on disk before writing
+        index = self.read_partial_movie_cache_index()
+        for key, entry in self.partial_movie_cache_index.items():
+            if key not in index or index[key]["last_used"] < entry["last_used"]:
+                index[key] = entry
+        index = {
+            key: entry
+            for key, entry in index.items()
+            if os.path.exists(self.get_cached_partial_movie_path(key))
+        }
+        self.evict_from_partial_movie_cache(index)
+        self.partial_movie_cache_index = index
+
+        temp_path = f"{self.partial_movie_cache_index_path}.{os.getpid()}"
+        with open(temp_path, "w") as fp:
+            json.dump(index, fp)
+        os.replace(temp_path, self.partial_movie_cache_index_path)
+
+    def evict_from_partial_movie_cache(self, index: dict[str, dict[str, float]]) -> None:
+        # Drop least recently used movies until under the size cap
+        max_size = self.partial_movie_cache_max_mb * 1024 * 1024
+        total_size = sum(entry["size"] for entry in index.values())
+        by_last_use = sorted(index, key=lambda k: index[k]["last_used"])
+        for key in by_last_use:
+            if total_size <= max_size:
+                break
+            total_size -= index.pop(key)["size"]
+            try:
+                os.remove(self.get_cached_partial_movie_path(key))
+            except OSError:
+                pass
+
+    def has_cached_partial_movie(self, key: str | None) -> bool:
+        return key is not None and os.path.exists(self.get_cached_partial_movie_path(key))
+
+    def use_cached_partial_movie(self, key: str) -> None:
+        """
+        Stands in the cached movie for the next partial movie file, in
+        place of rendering it
+        """
+        shutil.copyfile(
+            self.get_cached_partial_movie_path(key),
+            self.get_next_partial_movie_path(),
+        )
+        self.partial_movie_cache_index[key] = {
+            "size": os.path.getsize(self.get_cached_partial_movie_path(key)),
+            "last_used": time.time(),
+        }
+        self.write_partial_movie_cache_index()
+
+    def add_to_partial_movie_cache(self, key: str, file_path: str) -> None:
+        cache_path = self.get_cached_partial_movie_path(key)
+        temp_path = f"{cache_path}.{os.getpid()}"
+        shutil.copyfile(file_path, temp_path)
+        os.replace(temp_path, cache_path)
+        self.partial_movie_cache_index[key] = {
+            "size": os.path.getsize(cache_path),
+            "last_used": time.time(),
+        }
+        self.write_partial_movie_cache_index()
+
+    # Timelines, saved so that later renders of an unchanged
+    # scene needn't do a dry run to count its frames
+    def save_timeline(self, timeline: dict[str, float]) -> None:
+        if not self.input_file_path:
+            return
+        path = get_scene_timeline_path(self.input_file_path, str(self.scene))
+        timeline = dict(
+            timeline,
+            source_hash=get_file_hash(self.input_file_path),
+            # Other modules the scene imported, whose edits can also
+            # change how many plays and waits it has
+            module_hashes=get_source_file_hashes(),
+            version=__version__,
+            start_at_animation_number=self.scene.start_at_animation_number,
+            end_at_animation_number=self.scene.end_at_animation_number,
+        )
+        temp_path = path + ".tmp"
+        with open(temp_path, "w") as fp:
+            json.dump(timeline, fp)
+        os.replace(temp_path, path)
+
     def get_saved_mobject_directory(self) -> str:
         return guarantee_existence(self.saved_mobject_directory)
 
@@ -210,16 +352,24 @@ class SceneFileWriter(object):
         if self.break_into_partial_movies and self.write_to_movie:
             self.open_movie_pipe(self.get_next_partial_movie_path())
 
-    def end_animation(self) -> None:
+    def end_animation(self, cache_key: str | None = None) -> None:
         if self.break_into_partial_movies and self.write_to_movie:
             self.close_movie_pipe()
+            if cache_key is not None and self.cache_partial_movies:
+                self.add_to_partial_movie_cache(cache_key, self.final_file_path)
 
     def finish(self) -> None:
         if self.write_to_movie:
             if self.break_into_partial_movies:
+                if self.writing_process is not None:
+                    # Interrupted partway through an animation
+                    self.close_movie_pipe()
+                if not self.combine_partial_movies:
+                    return
                 self.combine_movie_files()
             else:
                 self.close_movie_pipe()
+            self.report_frame_queue_stats()
             if self.includes_sound:
                 self.add_sound_to_video()
             self.print_file_ready_message(self.get_movie_file_path())
@@ -264,6 +414,8 @@ class SceneFileWriter(object):
             ]
         command += [self.temp_file_path]
         self.writing_process = sp.Popen(command, stdin=sp.PIPE)
+        if self.frame_queue_size > 0:
+            self.start_writer_thread()
 
         if self.total_frames > 0:
             self.progress_display = ProgressDisplay(
@@ -287,21 +439,132 @@ class SceneFileWriter(object):
 
     def write_frame(self, camera: Camera) -> None:
         if self.write_to_movie:
-            raw_bytes = camera.get_raw_fbo_data()
+            if camera.uses_async_readback():
+                # Bytes for an earlier frame, if any are ready
+                raw_bytes = camera.queue_fbo_readback()
+                if raw_bytes is None:
+                    return
+            else:
+                raw_bytes = camera.get_raw_fbo_data()
+            self.write_raw_frame(raw_bytes)
+
+    def write_raw_frame(self, raw_bytes: bytes) -> None:
+        if self.writer_thread is not None:
+            self.enqueue_frame(raw_bytes)
+        else:
             self.writing_process.stdin.write(raw_bytes)
-            if self.has_progress_display:
-                self.progress_display.update()
+        if self.has_progress_display:
+            if self.progress_display.n >= self.progress_display.total:
+                # The frame count was only an estimate
+                self.progress_display.total = self.progress_display.n + 1
+            self.progress_display.update()
+
+    # Writing frames from a background thread
+    def start_writer_thread(self) -> None:
+        self.frame_queue: queue.Queue[bytes | None] = queue.Queue(
+            maxsize=self.frame_queue_size
+        )
+        self.writer_error: Exception | None = None
+        self.writer_thread = threading.Thread(
+            target=self.write_queued_frames,
+            args=(self.frame_queue, self.writing_process.stdin),
+            daemon=True,
+        )
+        self.writer_thread.start()
+
+    def write_queued_frames(self, frame_queue: queue.Queue, stdin) -> None:
+        # Runs on the writer thread until it receives None
+        while True:
+            raw_bytes = frame_queue.get()
+            if raw_bytes is None:
+                return
+            if frame_queue.empty():
+                self.frame_queue_stats["n_writer_starved"] += 1
+            if self.writer_error is not None:
+                # Keep draining so the main thread never blocks on a full queue
+                continue
+            try:
+                stdin.write(raw_bytes)
+            except (BrokenPipeError, OSError) as err:
+                self.writer_error = err
+
+    def enqueue_frame(self, raw_bytes: bytes) -> None:
+        if self.writer_error is not None:
+            raise self.writer_error
+        stats = self.frame_queue_stats
+        depth = self.frame_queue.qsize()
+        stats["n_frames"] += 1
+        stats["total_depth"] += depth
+        stats["max_depth"] = max(stats["max_depth"], depth)
+        if self.frame_queue.full():
+            # Waiting on ffmpeg, i.e. the render is encoder-bound
+            stats["n_blocked_puts"] += 1
+        self.frame_queue.put(raw_bytes)
+
+    def stop_writer_thread(self) -> None:
+        if self.ended_with_interrupt:
+            # Don't bother encoding frames which were still waiting
+            try:
+                while True:
+                    self.frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+        self.frame_queue.put(None)
+        self.writer_thread.join()
+        self.writer_thread = None
+        if self.writer_error is not None and not self.ended_with_interrupt:
+            log.error(f"Writing frames to ffmpeg failed: {self.writer_error}")
+
+    def init_frame_queue_stats(self) -> None:
+        self.frame_queue_stats: dict[str, int] = {
+            "n_frames": 0,
+            "total_depth": 0,
+            "max_depth": 0,
+            "n_blocked_puts": 0,
+            "n_writer_starved": 0,
+        }
+
+    def get_frame_queue_stats(self) -> dict[str, float]:
+        stats = dict(self.frame_queue_stats)
+        n_frames = max(stats["n_frames"], 1)
+        stats["mean_depth"] = stats["total_depth"] / n_frames
+        stats["blocked_fraction"] = stats["n_blocked_puts"] / n_frames
+        stats["starved_fraction"] = stats["n_writer_starved"] / n_frames
+        return stats
+
+    def report_frame_queue_stats(self) -> None:
+        if self.frame_queue_size <= 0 or self.frame_queue_stats["n_frames"] == 0:
+            return
+        stats = self.get_frame_queue_stats()
+        # Mostly full queues mean ffmpeg is the bottleneck, mostly
+        # empty ones mean producing frames is
+        log.debug(
+            "Frame queue: {n_frames} frames, mean depth {mean_depth:.1f}, "
+            "max depth {max_depth}/{size}, blocked on a full queue for "
+            "{blocked_fraction:.0%} of frames, writer waited on an empty "
+            "queue for {starved_fraction:.0%}".format(size=self.frame_queue_size, **stats)
+        )
+
+    def flush_pending_frames(self) -> None:
+        # Frames still being read back from the gpu belong to this movie
+        for raw_bytes in self.scene.camera.flush_fbo_readbacks():
+            self.write_raw_frame(raw_bytes)
 
     def close_movie_pipe(self) -> None:
+        if not self.ended_with_interrupt:
+            self.flush_pending_frames()
+        if self.writer_thread is not None:
+            self.stop_writer_thread()
         self.writing_process.stdin.close()
         self.writing_process.wait()
         self.writing_process.terminate()
+        self.writing_process = None
         if self.has_progress_display:
             self.progress_display.close()
 
         if not self.ended_with_interrupt:
             shutil.move(self.temp_file_path, self.final_file_path)
-        else:
+        elif not self.break_into_partial_movies:
             self.movie_file_path = self.temp_file_path
 
     def combine_movie_files(self) -> None:
@@ -435,3 +698,43 @@ class SceneFileWriter(object):
         if self.quiet:
             sys.stdout.close()
             sys.stdout = curr_stdout
+
+
+def get_scene_timeline_path(input_file_path: str, scene_name: str) -> str:
+    key = get_content_hash(os.path.abspath(input_file_path), scene_name)
+    return os.path.join(get_scene_timeline_dir(), key[:32] + ".json")
+
+
+def load_scene_timeline(input_file_path: str, scene_name: str) -> dict | None:
+    path = get_scene_timeline_path(input_file_path, scene_name)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path) as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return None
+
+
+def is_timeline_current(
+    timeline: dict,
+    input_file_path: str,
+    start_at_animation_number: int | None,
+    end_at_animation_number: int | None
+) -> bool:
+    """
+    Whether a saved timeline matches the scene as it would be run now,
+    comparing the scene's file along with any other modules it imported
+    from outside of manimlib and installed packages
+    """
+    module_hashes = timeline.get("module_hashes", {})
+    return all([
+        timeline.get("source_hash") == get_file_hash(input_file_path),
+        all(
+            os.path.exists(path) and get_file_hash(path) == file_hash
+            for path, file_hash in module_hashes.items()
+        ),
+        timeline.get("version") == __version__,
+        timeline.get("start_at_animation_number") == start_at_animation_number,
+        timeline.get("end_at_animation_number") == end_at_animation_number,
+    ])
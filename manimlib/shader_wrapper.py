@@ -62,11 +62,21 @@ class ShaderWrapper(object):
             self.render_primitive == shader_wrapper.render_primitive,
         ))
 
-    def copy(self):
+    def copy(self, copy_data: bool = True):
+        """
+        Without copy_data, the copy gets empty vert_data and
+        vert_indices, to be filled in before it's rendered
+        """
         result = copy.copy(self)
-        result.vert_data = np.array(self.vert_data)
+        if copy_data:
+            result.vert_data = np.array(self.vert_data)
+        else:
+            result.vert_data = self.vert_data[:0].copy()
         if result.vert_indices is not None:
-            result.vert_indices = np.array(self.vert_indices)
+            if copy_data:
+                result.vert_indices = np.array(self.vert_indices)
+            else:
+                result.vert_indices = self.vert_indices[:0].copy()
         if self.uniforms:
             result.uniforms = {key: np.array(value) for key, value in self.uniforms.items()}
         if self.texture_paths:
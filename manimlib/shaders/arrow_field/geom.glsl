@@ -0,0 +1,58 @@
+#version 330
+
+layout (points) in;
+layout (triangle_strip, max_vertices = 7) out;
+
+// Needed for get_gl_Position
+uniform vec2 frame_shape;
+uniform float focal_distance;
+uniform float is_fixed_in_frame;
+
+uniform float arrow_width;
+uniform float tip_width;
+uniform float tip_length;
+uniform float max_tip_length_to_length_ratio;
+
+in vec3 v_start[1];
+in vec3 v_end[1];
+in vec4 v_color[1];
+
+out vec4 color;
+
+#INSERT get_gl_Position.glsl
+
+void emit_vertex(vec3 point){
+    color = v_color[0];
+    gl_Position = get_gl_Position(point);
+    EmitVertex();
+}
+
+
+void main() {
+    vec3 vect = v_end[0] - v_start[0];
+    float vect_len = length(vect);
+    if(vect_len == 0) return;
+    vec3 unit = vect / vect_len;
+    // Arrows are drawn flat, facing the camera
+    vec2 normal = vec2(-unit.y, unit.x);
+    if(normal == vec2(0.0)) return;
+    vec3 perp = vec3(normalize(normal), 0.0);
+
+    // Arrows too short for a full tip are shrunk down as a whole
+    float tip_len = min(tip_length, max_tip_length_to_length_ratio * vect_len);
+    float scale = tip_len / tip_length;
+    vec3 body_perp = 0.5 * scale * arrow_width * perp;
+    vec3 tip_perp = 0.5 * scale * tip_width * perp;
+    vec3 tip_base = v_end[0] - tip_len * unit;
+
+    emit_vertex(v_start[0] - body_perp);
+    emit_vertex(v_start[0] + body_perp);
+    emit_vertex(tip_base - body_perp);
+    emit_vertex(tip_base + body_perp);
+    EndPrimitive();
+
+    emit_vertex(tip_base - tip_perp);
+    emit_vertex(tip_base + tip_perp);
+    emit_vertex(v_end[0]);
+    EndPrimitive();
+}
@@ -0,0 +1,19 @@
+#version 330
+
+#INSERT camera_uniform_declarations.glsl
+
+in vec3 point;
+in vec3 vect;
+in vec4 color;
+
+out vec3 v_start;
+out vec3 v_end;
+out vec4 v_color;
+
+#INSERT position_point_into_frame.glsl
+
+void main(){
+    v_start = position_point_into_frame(point);
+    v_end = position_point_into_frame(point + vect);
+    v_color = color;
+}
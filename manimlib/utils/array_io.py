@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+
+import numpy as np
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+# Files hold a json header describing a set of named arrays, followed by the
+# raw bytes of each array.  Each array starts on an aligned offset, so that
+# it can be viewed directly from a memory map of the file without copying.
+ARRAY_FILE_MAGIC = b"MNGLARR"
+ARRAY_FILE_VERSION = 1
+ARRAY_ALIGNMENT = 64
+
+
+def _pad_length(length: int) -> int:
+    return -length % ARRAY_ALIGNMENT
+
+
+def write_array_file(
+    file_path: str,
+    arrays: dict[str, np.ndarray],
+    metadata: Any = None
+) -> None:
+    """
+    Write to a temporary file first, then move it into place, so that other
+    processes reading the same file never see it half-written.
+    """
+    arrays = {
+        name: np.ascontiguousarray(array)
+        for name, array in arrays.items()
+    }
+    array_specs = []
+    offset = 0
+    for name, array in arrays.items():
+        array_specs.append({
+            "name": name,
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset,
+        })
+        offset += array.nbytes + _pad_length(array.nbytes)
+    header = json.dumps({
+        "version": ARRAY_FILE_VERSION,
+        "arrays": array_specs,
+        "metadata": metadata,
+    }).encode()
+    prefix_length = len(ARRAY_FILE_MAGIC) + 4 + len(header)
+
+    temp_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as fp:
+        fp.write(ARRAY_FILE_MAGIC)
+        fp.write(struct.pack("<I", len(header)))
+        fp.write(header)
+        fp.write(bytes(_pad_length(prefix_length)))
+        for array in arrays.values():
+            fp.write(array.tobytes())
+            fp.write(bytes(_pad_length(array.nbytes)))
+    os.replace(temp_path, file_path)
+
+
+def is_array_file(file_path: str) -> bool:
+    with open(file_path, "rb") as fp:
+        return fp.read(len(ARRAY_FILE_MAGIC)) == ARRAY_FILE_MAGIC
+
+
+def read_array_file(
+    file_path: str,
+    mmap: bool = True
+) -> tuple[dict[str, np.ndarray], Any]:
+    """
+    Returns the arrays and metadata stored with write_array_file.  With mmap,
+    arrays are read-only views into a memory map of the file, so only the
+    parts actually used are read from disk.
+    """
+    with open(file_path, "rb") as fp:
+        magic = fp.read(len(ARRAY_FILE_MAGIC))
+        if magic != ARRAY_FILE_MAGIC:
+            raise ValueError(f"{file_path} is not an array file")
+        header_length, = struct.unpack("<I", fp.read(4))
+        header = json.loads(fp.read(header_length))
+        if header["version"] != ARRAY_FILE_VERSION:
+            raise ValueError(
+                f"{file_path} has array file version {header['version']}, "
+                f"expected {ARRAY_FILE_VERSION}"
+            )
+        prefix_length = len(ARRAY_FILE_MAGIC) + 4 + header_length
+        data_start = prefix_length + _pad_length(prefix_length)
+        if mmap:
+            buffer = np.memmap(fp, dtype=np.uint8, mode="r")
+        else:
+            fp.seek(0)
+            buffer = fp.read()
+
+    arrays = {}
+    for spec in header["arrays"]:
+        dtype = np.dtype(spec["dtype"])
+        shape = tuple(spec["shape"])
+        count = int(np.prod(shape))
+        array = np.frombuffer(
+            buffer, dtype=dtype, count=count,
+            offset=data_start + spec["offset"],
+        )
+        arrays[spec["name"]] = array.reshape(shape)
+    return arrays, header["metadata"]
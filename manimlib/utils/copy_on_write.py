@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import hashlib
+
+import numpy as np
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, Hashable, Iterable
+
+
+class CopyOnWriteDict(dict):
+    """
+    Dictionary of arrays which can share those arrays with its copies.
+
+    Shared arrays are never modified in place.  Instead, looking one up
+    with d[key] first swaps in a private copy, since that is how arrays
+    get modified, e.g. d[key][:] = value.  Lookups which only read can use
+    peek to avoid that copy, as can iterating over items() or values().
+    Sharing an array also marks it read-only, so writing to one obtained
+    before it was shared raises an error rather than changing the copies.
+
+    Likewise, the hash of an array is cached until d[key] is next looked
+    up, which is assumed to be how it gets changed, so reads through peek
+    keep the cache.  Copies start out with the same hashes.
+
+    Arrays only change length by being replaced, so resize_callback, if
+    set, is called with the key of any array replaced by one of a different
+    length, or removed.  It isn't passed on to copies made with copy().
+    """
+    def __init__(self, *args, **kwargs):
+        self.shared_keys: set[Hashable] = set()
+        self.array_hashes: dict[Hashable, bytes] = dict()
+        self.fingerprint: bytes | None = None
+        self.resize_callback: Callable[[Hashable], None] | None = None
+        super().__init__(*args, **kwargs)
+
+    def __reduce__(self):
+        # Pickled and deep copies get their own arrays, so nothing is shared
+        return (
+            self.__class__,
+            (dict(self.items()),),
+            {"resize_callback": self.resize_callback},
+        )
+
+    def __getitem__(self, key: Hashable) -> np.ndarray:
+        array = dict.__getitem__(self, key)
+        if key in self.array_hashes:
+            del self.array_hashes[key]
+            self.fingerprint = None
+        if array.flags.writeable:
+            # Not shared
+            return array
+        if key in self.shared_keys:
+            self.shared_keys.discard(key)
+            array = array.copy()
+        else:
+            try:
+                array.flags.writeable = True
+            except ValueError:
+                # E.g. arrays read from a memory map
+                array = array.copy()
+        dict.__setitem__(self, key, array)
+        return array
+
+    def __setitem__(self, key: Hashable, value: np.ndarray) -> None:
+        if self.array_hashes:
+            self.array_hashes.pop(key, None)
+        self.fingerprint = None
+        if self.shared_keys:
+            self.shared_keys.discard(key)
+        self.note_resize(key, dict.get(self, key), value)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        self.note_resize(key, dict.get(self, key), None)
+        self.array_hashes.pop(key, None)
+        self.fingerprint = None
+        self.shared_keys.discard(key)
+        super().__delitem__(key)
+
+    def pop(self, key: Hashable, *args):
+        self.note_resize(key, dict.get(self, key), None)
+        self.array_hashes.pop(key, None)
+        self.fingerprint = None
+        self.shared_keys.discard(key)
+        return super().pop(key, *args)
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def note_resize(
+        self,
+        key: Hashable,
+        old_value: np.ndarray | None,
+        new_value: np.ndarray | None
+    ) -> None:
+        if self.resize_callback is None:
+            return
+        old_len = None if old_value is None else np.shape(old_value)[:1]
+        new_len = None if new_value is None else np.shape(new_value)[:1]
+        if old_len != new_len:
+            self.resize_callback(key)
+
+    def peek(self, key: Hashable) -> np.ndarray:
+        return super().__getitem__(key)
+
+    def copy(self) -> CopyOnWriteDict:
+        for array in self.values():
+            array.flags.writeable = False
+        result = CopyOnWriteDict(self.items())
+        self.shared_keys.update(self.keys())
+        result.shared_keys.update(self.keys())
+        result.array_hashes.update(self.array_hashes)
+        result.fingerprint = self.fingerprint
+        return result
+
+    def share_from(
+        self,
+        other: CopyOnWriteDict,
+        keys: Iterable[Hashable] | None = None
+    ) -> None:
+        if keys is None:
+            keys = list(other.keys())
+        self.fingerprint = None
+        for key in keys:
+            array = other.peek(key)
+            array.flags.writeable = False
+            self.note_resize(key, dict.get(self, key), array)
+            super().__setitem__(key, array)
+            self.shared_keys.add(key)
+            other.shared_keys.add(key)
+            if key in other.array_hashes:
+                self.array_hashes[key] = other.array_hashes[key]
+            else:
+                self.array_hashes.pop(key, None)
+
+    def get_array_hash(self, key: Hashable) -> bytes:
+        if key not in self.array_hashes:
+            array = np.ascontiguousarray(self.peek(key))
+            hasher = hashlib.sha1(f"{array.dtype.str}{array.shape}".encode())
+            hasher.update(array)
+            self.array_hashes[key] = hasher.digest()
+        return self.array_hashes[key]
+
+    def get_fingerprint(self) -> bytes:
+        """
+        Digest of all keys and arrays, which only needs to rehash
+        arrays that might have changed since the last call
+        """
+        if self.fingerprint is None:
+            hasher = hashlib.sha1()
+            for key in sorted(self.keys()):
+                hasher.update(str(key).encode())
+                hasher.update(self.get_array_hash(key))
+            self.fingerprint = hasher.digest()
+        return self.fingerprint
@@ -26,6 +26,10 @@ def get_mobject_data_dir() -> str:
     return guarantee_existence(os.path.join(get_temp_dir(), "mobject_data"))
 
 
+def get_scene_timeline_dir() -> str:
+    return guarantee_existence(os.path.join(get_temp_dir(), "scene_timelines"))
+
+
 def get_downloads_dir() -> str:
     return guarantee_existence(os.path.join(get_temp_dir(), "manim_downloads"))
 
@@ -75,6 +75,8 @@ def get_sorted_integer_files(
             index_str = file
 
         full_path = os.path.join(directory, file)
+        if os.path.isdir(full_path):
+            continue
         if index_str.isdigit():
             index = int(index_str)
             if remove_indices_greater_than is not None:
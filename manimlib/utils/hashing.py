@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+from functools import lru_cache
+import hashlib
+import os
+import re
+import sys
+import sysconfig
+import types
+
+import numpy as np
+
+from manimlib.mobject.mobject import Mobject
+from manimlib.shader_wrapper import ShaderWrapper
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Iterable
+
+
+# Unlike the builtin hash, which is salted differently for each process,
+# these hashes are stable from one run to the next, so they can be used
+# to key caches stored on disk.
+
+# Mobject attributes which either get hashed separately, are derived
+# from the rest, or don't affect how the mobject is drawn
+UNHASHED_MOBJECT_ATTRS = {
+    "submobjects", "parents", "family", "family_cache",
+    "family_version", "ancestry_version",
+    "data", "uniforms", "non_time_updaters", "time_based_updaters",
+    "target", "saved_state", "file_member",
+}
+# Reprs of objects which are only identified by where they are in memory
+MEMORY_ADDRESS_PATTERN = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+class IncompleteHashError(Exception):
+    """
+    Raised by strict hashes for objects which can't be fully described,
+    since two such objects might differ but still hash the same
+    """
+    pass
+
+
+def get_content_hash(
+    *objects: Any,
+    max_depth: int = 6,
+    strict: bool = False,
+    opaque: Iterable[Any] = (),
+) -> str:
+    """
+    Objects nested deeper than max_depth, or which can only be described
+    by their place in memory, are normally described just by their type.
+    With strict, they instead raise an IncompleteHashError.  Objects in
+    opaque are also only described by their type, for those whose
+    relevant state is accounted for by some other part of the hash.
+    """
+    hasher = hashlib.sha256()
+    opaque_ids = set(map(id, opaque))
+    seen = dict()
+    for obj in objects:
+        update_hash(hasher, obj, max_depth, seen, strict, opaque_ids)
+    return hasher.hexdigest()
+
+
+def get_file_hash(file_path: str) -> str:
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as fp:
+        hasher.update(fp.read())
+    return hasher.hexdigest()
+
+
+def update_hash(
+    hasher,
+    obj: Any,
+    depth: int = 6,
+    seen: dict[int, int] | None = None,
+    strict: bool = False,
+    opaque_ids: set[int] | frozenset[int] = frozenset(),
+) -> None:
+    """
+    Feed a description of obj into hasher.  Mobjects contribute the data,
+    uniforms and other attributes of their whole family, functions
+    contribute their code along with any constants, defaults, closure
+    values and the globals they reference, classes defined outside of
+    manimlib and installed packages contribute their methods and other
+    attributes, and other objects are described through their class and
+    attributes, down to the given depth.
+    """
+    if seen is None:
+        seen = dict()
+
+    def update(*args):
+        for arg in args:
+            hasher.update(str(arg).encode())
+
+    def describe_partially(reason):
+        if strict:
+            raise IncompleteHashError(f"{type(obj).__name__} {reason}")
+        update(reason, type(obj).__name__)
+
+    if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+        update(type(obj).__name__, repr(obj))
+        return
+    if isinstance(obj, bytes):
+        update("bytes", len(obj))
+        hasher.update(obj)
+        return
+    if isinstance(obj, np.ndarray):
+        update("ndarray", obj.dtype, obj.shape)
+        hasher.update(np.ascontiguousarray(obj).tobytes())
+        return
+    if isinstance(obj, np.generic):
+        update(type(obj).__name__, repr(obj.item()))
+        return
+
+    if id(obj) in opaque_ids:
+        update("opaque", type(obj).__name__)
+        return
+    if id(obj) in seen:
+        # Refer back to where it was first described
+        update("seen", seen[id(obj)])
+        return
+    if depth <= 0:
+        describe_partially("beyond max depth")
+        return
+    seen[id(obj)] = len(seen)
+
+    def recurse(value):
+        update_hash(hasher, value, depth - 1, seen, strict, opaque_ids)
+
+    if isinstance(obj, Mobject):
+        for mob in obj.get_family():
+            recurse(type(mob))
+            for name in ("data", "uniforms"):
+                values = dict(getattr(mob, name).items())
+                for key in sorted(values):
+                    update(key)
+                    recurse(values[key])
+            for updater in mob.get_updaters():
+                recurse(updater)
+            for attr, value in sorted(vars(mob).items()):
+                if attr in UNHASHED_MOBJECT_ATTRS or attr in mob.shader_buffer_attrs:
+                    continue
+                if isinstance(value, ShaderWrapper):
+                    # Determined by shader_folder, texture_paths, and the like
+                    continue
+                update(attr)
+                recurse(value)
+    elif isinstance(obj, (list, tuple)):
+        update(type(obj).__name__, len(obj))
+        for elem in obj:
+            recurse(elem)
+    elif isinstance(obj, (set, frozenset)):
+        update("set", len(obj))
+        elem_hashes = sorted(
+            get_content_hash(elem, max_depth=depth - 1, strict=strict, opaque=())
+            for elem in obj
+        )
+        for elem_hash in elem_hashes:
+            update(elem_hash)
+    elif isinstance(obj, dict):
+        update("dict", len(obj))
+        for key, value in obj.items():
+            recurse(key)
+            recurse(value)
+    elif isinstance(obj, types.MethodType):
+        recurse(obj.__func__)
+        recurse(obj.__self__)
+    elif isinstance(obj, types.FunctionType):
+        code = obj.__code__
+        update("function", obj.__module__, obj.__qualname__)
+        # Code from manimlib itself is pinned down by its version
+        if not is_library_module(obj.__module__):
+            hasher.update(code.co_code)
+            recurse(code.co_consts)
+            for name in sorted(get_global_names(code)):
+                if name in obj.__globals__:
+                    update(name)
+                    recurse(obj.__globals__[name])
+        recurse(obj.__defaults__)
+        recurse(obj.__kwdefaults__)
+        if obj.__closure__:
+            for cell in obj.__closure__:
+                try:
+                    recurse(cell.cell_contents)
+                except ValueError:
+                    # Empty cell
+                    pass
+    elif isinstance(obj, types.CodeType):
+        update("code", obj.co_name)
+        hasher.update(obj.co_code)
+        recurse(obj.co_consts)
+    elif isinstance(obj, type):
+        update("type", obj.__module__, obj.__qualname__)
+        # Classes from manimlib are pinned down by its version, but
+        # the methods and attributes of any others need describing
+        for cls in obj.__mro__:
+            if is_library_module(cls.__module__):
+                continue
+            update(cls.__module__, cls.__qualname__)
+            for attr, value in sorted(vars(cls).items()):
+                if attr.startswith("__") and attr not in ("__init__", "__call__"):
+                    continue
+                if isinstance(value, (staticmethod, classmethod)):
+                    value = value.__func__
+                elif isinstance(value, property):
+                    value = (value.fget, value.fset)
+                update(attr)
+                recurse(value)
+    elif isinstance(obj, (types.BuiltinFunctionType, types.ModuleType)):
+        update(type(obj).__name__, getattr(obj, "__qualname__", obj.__name__))
+    elif hasattr(obj, "__dict__"):
+        recurse(type(obj))
+        recurse(vars(obj))
+    else:
+        description = repr(obj)
+        if MEMORY_ADDRESS_PATTERN.search(description):
+            describe_partially("only identified by address")
+        else:
+            update(type(obj).__name__, description)
+
+
+@lru_cache(maxsize=None)
+def is_library_module(module_name: str | None) -> bool:
+    """
+    Whether a module belongs to manimlib, the standard library or an
+    installed package, as opposed to the code being rendered
+    """
+    module_name = module_name or ""
+    if module_name.split(".")[0] == "manimlib":
+        return True
+    file_path = getattr(sys.modules.get(module_name), "__file__", None)
+    if file_path is None:
+        # Builtin modules, and functions without a module
+        return module_name != "__main__"
+    file_path = os.path.normcase(os.path.realpath(file_path))
+    paths = sysconfig.get_paths()
+    library_dirs = [
+        # manimlib itself, e.g. for python -m manimlib
+        os.path.dirname(os.path.dirname(__file__)),
+        *(paths[name] for name in ("stdlib", "platstdlib", "purelib", "platlib") if name in paths),
+    ]
+    return any(
+        file_path.startswith(os.path.normcase(os.path.realpath(lib_dir)) + os.sep)
+        for lib_dir in library_dirs
+    )
+
+
+def get_source_file_hashes() -> dict[str, str]:
+    """
+    Hashes of the files of all imported modules which aren't part of
+    manimlib, the standard library or an installed package
+    """
+    result = dict()
+    for name, module in list(sys.modules.items()):
+        file_path = getattr(module, "__file__", None)
+        if file_path is None or not file_path.endswith(".py"):
+            continue
+        if is_library_module(name) or not os.path.exists(file_path):
+            continue
+        result[os.path.abspath(file_path)] = get_file_hash(file_path)
+    return result
+
+
+def get_global_names(code: types.CodeType) -> set[str]:
+    # Names looked up by the code, or by any functions defined within it
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.update(get_global_names(const))
+    return names
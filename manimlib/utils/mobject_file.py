@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import importlib
+import itertools as it
+
+import numpy as np
+
+from manimlib.logger import log
+from manimlib.mobject.mobject import Group
+from manimlib.mobject.mobject import Mobject
+from manimlib.mobject.types.dot_cloud import DotCloud
+from manimlib.mobject.types.point_cloud_mobject import PMobject
+from manimlib.mobject.types.vectorized_mobject import VGroup
+from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.array_io import read_array_file
+from manimlib.utils.array_io import write_array_file
+from manimlib.utils.copy_on_write import CopyOnWriteDict
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterator
+
+
+# Mobjects are saved as a header describing the family tree, with the type
+# of each member and any small values, followed by one contiguous array per
+# type of data, holding that data for all members end to end.  Members of
+# subclasses of these types are built as the base type, then given back
+# their class and whichever of their attributes could be stored.
+MOBJECT_FILE_TYPES: dict[str, type] = {
+    "VGroup": VGroup,
+    "VMobject": VMobject,
+    "DotCloud": DotCloud,
+    "PMobject": PMobject,
+}
+# Unlike those above, subclasses of these can hold data of any kind, so
+# members have to be exactly one of these types
+MOBJECT_FILE_CONTAINER_TYPES: dict[str, type] = {
+    "Group": Group,
+    "Mobject": Mobject,
+}
+# Other attributes which affect how members are rendered
+MOBJECT_FILE_ATTRS: dict[str, list[str]] = {
+    "VGroup": ["depth_test", "joint_type", "flat_stroke", "draw_stroke_behind_fill"],
+    "VMobject": ["depth_test", "joint_type", "flat_stroke", "draw_stroke_behind_fill"],
+    "DotCloud": ["depth_test"],
+    "PMobject": ["depth_test"],
+    "Group": ["depth_test"],
+    "Mobject": ["depth_test"],
+}
+# Attributes which are stored some other way, or rebuilt on loading
+MOBJECT_FILE_UNSTORED_ATTRS = {
+    "submobjects", "parents", "family", "family_cache",
+    "family_version", "ancestry_version", "topology_version",
+    "data", "uniforms", "triangulation", "file_member",
+    "needs_new_triangulation", "needs_new_bounding_box",
+    "target", "saved_state",
+}
+
+
+# Types of attributes which might be storable, depending on what they hold
+STORABLE_TYPES = (
+    type(None), bool, int, float, str,
+    np.generic, np.ndarray, list, tuple, dict, Mobject,
+)
+
+
+class UnstorableValue(Exception):
+    pass
+
+
+def get_mobject_file_type(mobject: Mobject) -> str:
+    for name, mob_type in MOBJECT_FILE_CONTAINER_TYPES.items():
+        if type(mobject) is mob_type:
+            return name
+    for name, mob_type in MOBJECT_FILE_TYPES.items():
+        if isinstance(mobject, mob_type):
+            return name
+    raise ValueError(
+        f"{type(mobject).__name__} can't be stored in a mobject file"
+    )
+
+
+def get_class_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def find_class(class_path: str) -> type | None:
+    module_name, qualname = class_path.split(":")
+    try:
+        result = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            result = getattr(result, name)
+    except (ImportError, AttributeError):
+        return None
+    return result if isinstance(result, type) else None
+
+
+def find_mobjects(value: Any) -> Iterator[Mobject]:
+    if isinstance(value, Mobject):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from find_mobjects(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from find_mobjects(item)
+
+
+def is_default_value(value: Any, default: Any) -> bool:
+    if isinstance(value, np.ndarray) or isinstance(default, np.ndarray):
+        return (
+            isinstance(value, np.ndarray)
+            and isinstance(default, np.ndarray)
+            and value.shape == default.shape
+            and np.array_equal(value, default)
+        )
+    try:
+        return type(value) is type(default) and bool(value == default)
+    except Exception:
+        # E.g. lists of arrays, or objects which can't be stored anyway
+        return False
+
+
+def to_json_value(value: Any) -> Any:
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    return value
+
+
+def encode_value(
+    value: Any,
+    member_indices: dict[int, int],
+    add_to_column: Callable[[np.ndarray], list]
+) -> Any:
+    """
+    Everything other than plain numbers and strings is wrapped in a
+    dict with a single key saying what it was
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Mobject):
+        if id(value) not in member_indices:
+            raise UnstorableValue()
+        return {"member": member_indices[id(value)]}
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind not in "biuf":
+            raise UnstorableValue()
+        if value.ndim == 0:
+            return {"scalar_array": [value.item(), value.dtype.str]}
+        return {"array": add_to_column(value)}
+    if isinstance(value, (list, tuple)):
+        key = "list" if isinstance(value, list) else "tuple"
+        return {key: [
+            encode_value(item, member_indices, add_to_column)
+            for item in value
+        ]}
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        return {"dict": {
+            key: encode_value(item, member_indices, add_to_column)
+            for key, item in value.items()
+        }}
+    raise UnstorableValue()
+
+
+def get_changed_attrs(mob: Mobject, template: Mobject) -> dict[str, Any]:
+    """
+    Attributes of mob which might be storable, and which a copy
+    of template doesn't already have
+    """
+    result = dict()
+    skipped = {*MOBJECT_FILE_UNSTORED_ATTRS, *mob.shader_buffer_attrs}
+    for attr, value in mob.__dict__.items():
+        if attr in skipped or not isinstance(value, STORABLE_TYPES):
+            continue
+        if attr in template.__dict__ and is_default_value(value, template.__dict__[attr]):
+            continue
+        result[attr] = value
+    return result
+
+
+def write_mobject_file(mobject: Mobject, file_path: str) -> None:
+    """
+    Raises a ValueError if some family member isn't one of the types
+    in MOBJECT_FILE_CONTAINER_TYPES, or a subclass of one of those in
+    MOBJECT_FILE_TYPES.  Attributes of members which can't be stored,
+    like functions, are left out.
+    """
+    members = list(dict.fromkeys(mobject.get_family()))
+    type_names = [get_mobject_file_type(mob) for mob in members]
+    indices = {id(mob): index for index, mob in enumerate(members)}
+    all_types = {**MOBJECT_FILE_TYPES, **MOBJECT_FILE_CONTAINER_TYPES}
+    templates = dict()
+    changed_attrs = []
+    # Other mobjects which members refer to, e.g. groups of some of their
+    # submobjects, are stored too, as long as their whole family can be
+    index = 0
+    while index < len(members):
+        mob, type_name = members[index], type_names[index]
+        if type_name not in templates:
+            templates[type_name] = all_types[type_name]()
+        changed_attrs.append(get_changed_attrs(mob, templates[type_name]))
+        for ref in find_mobjects(list(changed_attrs[-1].values())):
+            new_members = [
+                ref_mob for ref_mob in dict.fromkeys(ref.get_family())
+                if id(ref_mob) not in indices
+            ]
+            try:
+                new_type_names = list(map(get_mobject_file_type, new_members))
+            except ValueError:
+                continue
+            for ref_mob, ref_type_name in zip(new_members, new_type_names):
+                indices[id(ref_mob)] = len(members)
+                members.append(ref_mob)
+                type_names.append(ref_type_name)
+        index += 1
+
+    columns = dict()
+    column_lengths = dict()
+
+    def add_to_column(array: np.ndarray) -> list:
+        array = np.asarray(array)
+        array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+        name = f"{array.dtype.str}{list(array.shape[1:])}"
+        start = column_lengths.get(name, 0)
+        columns.setdefault(name, []).append(array)
+        column_lengths[name] = start + len(array)
+        return [name, start, start + len(array)]
+
+    member_infos = []
+    for mob, type_name, attrs in zip(members, type_names, changed_attrs):
+        # Computing a triangulation can also refresh other data
+        triangulation = mob.get_triangulation() if isinstance(mob, VMobject) else None
+        info = {
+            "type": type_name,
+            "submobjects": [indices[id(sm)] for sm in mob.submobjects],
+            "data": {
+                key: add_to_column(array)
+                for key, array in mob.data.items()
+            },
+            "uniforms": {
+                key: to_json_value(value)
+                for key, value in mob.uniforms.items()
+            },
+            "attrs": {
+                attr: to_json_value(getattr(mob, attr))
+                for attr in MOBJECT_FILE_ATTRS[type_name]
+            },
+            "stored_attrs": dict(),
+        }
+        for attr, value in attrs.items():
+            try:
+                info["stored_attrs"][attr] = encode_value(value, indices, add_to_column)
+            except UnstorableValue:
+                pass
+        if type(mob) is not all_types[type_name]:
+            info["class"] = get_class_path(type(mob))
+        if triangulation is not None:
+            info["triangulation"] = add_to_column(triangulation)
+        member_infos.append(info)
+
+    arrays = {
+        name: np.concatenate(column)
+        for name, column in columns.items()
+    }
+    write_array_file(file_path, arrays, {
+        "mobject_file": True,
+        "members": member_infos,
+    })
+
+
+class MobjectFileReader(object):
+    """
+    Builds the members of a mobject file as they're needed.  Each member's
+    submobjects and parents are only filled in once one of them is first
+    looked up, and its family once that is, so that loading a large
+    mobject and using part of it doesn't build the rest.
+    """
+    def __init__(self, file_path: str, mmap: bool = True):
+        self.file_path = file_path
+        self.mmap = mmap
+        self.arrays, metadata = read_array_file(file_path, mmap=mmap)
+        if not isinstance(metadata, dict) or not metadata.get("mobject_file"):
+            raise ValueError(f"{file_path} does not hold a mobject")
+        self.member_infos: list[dict] = metadata["members"]
+        self.parent_indices: list[list[int]] = [[] for _ in self.member_infos]
+        for index, info in enumerate(self.member_infos):
+            for sub_index in dict.fromkeys(info["submobjects"]):
+                self.parent_indices[sub_index].append(index)
+        self.members: dict[int, Mobject] = dict()
+        self.templates: dict[str, Mobject] = dict()
+        self.classes: dict[str, type | None] = dict()
+
+    def __reduce__(self):
+        # Rather than the arrays, keep the file path, along with the members
+        # built so far so that copies of the rest are linked up with those
+        return (self.__class__, (self.file_path, self.mmap), {"members": self.members})
+
+    def get_array(self, slice_info: list) -> np.ndarray:
+        name, start, end = slice_info
+        return self.arrays[name][start:end]
+
+    def decode_value(self, value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        (kind, content), = value.items()
+        if kind == "member":
+            return self.get_member(content)
+        if kind == "array":
+            # Unlike data arrays, nothing stops these from being written to
+            return np.array(self.get_array(content))
+        if kind == "scalar_array":
+            return np.array(content[0], dtype=content[1])
+        if kind == "list":
+            return [self.decode_value(item) for item in content]
+        if kind == "tuple":
+            return tuple(self.decode_value(item) for item in content)
+        return {key: self.decode_value(item) for key, item in content.items()}
+
+    def get_class(self, type_name: str, class_path: str) -> type | None:
+        if class_path not in self.classes:
+            cls = find_class(class_path)
+            if cls is None or not issubclass(cls, MOBJECT_FILE_TYPES[type_name]):
+                log.warning(
+                    f"Couldn't find {class_path}, so members of that class "
+                    f"in {self.file_path} are loaded as {type_name}"
+                )
+                cls = None
+            self.classes[class_path] = cls
+        return self.classes[class_path]
+
+    def get_member(self, index: int) -> Mobject:
+        if index in self.members:
+            return self.members[index]
+        info = self.member_infos[index]
+        type_name = info["type"]
+        if type_name not in self.templates:
+            all_types = {**MOBJECT_FILE_TYPES, **MOBJECT_FILE_CONTAINER_TYPES}
+            self.templates[type_name] = all_types[type_name]()
+        # Copying is much cheaper than initializing each member
+        mob = self.templates[type_name].copy()
+        for attr in ("submobjects", "parents", "family"):
+            del mob.__dict__[attr]
+        mob.file_member = (self, index)
+        self.members[index] = mob
+
+        # Arrays read from a memory map are read-only, so
+        # the first change to each swaps in a copy
+        mob.data = CopyOnWriteDict({
+            key: self.get_array(slice_info)
+            for key, slice_info in info["data"].items()
+        })
+        mob.data.resize_callback = mob.note_data_resize
+        mob.uniforms.update({
+            key: np.array(value) if isinstance(value, list) else value
+            for key, value in info["uniforms"].items()
+        })
+        for attr, value in info["attrs"].items():
+            setattr(mob, attr, value)
+        cls = None
+        if "class" in info:
+            cls = self.get_class(type_name, info["class"])
+        if cls is not None:
+            mob.__class__ = cls
+        for attr, value in info.get("stored_attrs", {}).items():
+            setattr(mob, attr, self.decode_value(value))
+        if cls is not None:
+            # In case the class renders with different shaders
+            mob.init_shader_data()
+        if "triangulation" in info:
+            mob.triangulation = self.get_array(info["triangulation"])
+            mob.needs_new_triangulation = False
+        mob.needs_new_bounding_box = True
+        # Shader wrapper ids depend on uniforms, and the template's are stale
+        for attr in ("shader_wrapper", "fill_shader_wrapper", "stroke_shader_wrapper"):
+            if hasattr(mob, attr):
+                getattr(mob, attr).uniforms = mob.get_shader_uniforms()
+        mob.refresh_shader_wrapper_id()
+        return mob
+
+    def build_member_links(self, mob: Mobject, attr: str) -> None:
+        """
+        Called by Mobject.__getattr__ when one of submobjects, parents
+        or family is first looked up on a member
+        """
+        _, index = mob.file_member
+        if attr == "family":
+            mob.family = [mob, *it.chain(*(
+                sm.get_family() for sm in mob.submobjects
+            ))]
+        else:
+            mob.submobjects = [
+                self.get_member(sub_index)
+                for sub_index in self.member_infos[index]["submobjects"]
+            ]
+            mob.parents = [
+                self.get_member(parent_index)
+                for parent_index in self.parent_indices[index]
+            ]
+        if all(key in mob.__dict__ for key in ("submobjects", "parents", "family")):
+            del mob.file_member
+
+
+def read_mobject_file(file_path: str, mmap: bool = True) -> Mobject:
+    """
+    With mmap, data arrays are read from the file only as they're used,
+    and each is only copied into memory once it's modified.  Members
+    are also only built as they're used, see MobjectFileReader.
+    """
+    return MobjectFileReader(file_path, mmap=mmap).get_member(0)
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from functools import reduce
 import math
-import operator as op
 import platform
 
 from mapbox_earcut import triangulate_float32 as earcut
@@ -319,6 +317,22 @@ def get_closest_point_on_line(
     return ((t * a) + ((1 - t) * b))
 
 
+def get_dists_to_segments(
+    points: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray
+) -> np.ndarray:
+    """
+    Distance from each point to the segment between the
+    corresponding start and end, computed for all rows at once
+    """
+    vects = ends - starts
+    lengths_squared = (vects**2).sum(-1)
+    alphas = ((points - starts) * vects).sum(-1) / np.where(lengths_squared > 0, lengths_squared, 1)
+    closest = starts + np.clip(alphas, 0, 1)[..., np.newaxis] * vects
+    return np.sqrt(((points - closest)**2).sum(-1))
+
+
 def get_winding_number(points: Iterable[float]) -> float:
     total_angle = 0
     for p1, p2 in adjacent_pairs(points):
@@ -386,16 +400,8 @@ def earclip_triangulation(verts: np.ndarray, ring_ends: list[int]) -> list:
         list(range(e0, e1))
         for e0, e1 in zip([0, *ring_ends], ring_ends)
     ]
-
-    def is_in(point, ring_id):
-        return abs(abs(get_winding_number([i - point for i in verts[rings[ring_id]]])) - 1) < 1e-5
-
-    def ring_area(ring_id):
-        ring = rings[ring_id]
-        s = 0
-        for i, j in zip(ring[1:], ring):
-            s += cross2d(verts[i], verts[j])
-        return abs(s) / 2
+    starts = np.array([0, *ring_ends[:-1]], dtype=int)
+    ends = np.array(ring_ends, dtype=int)
 
     # Points at the same position may cause problems
     for i in rings:
@@ -404,23 +410,55 @@ def earclip_triangulation(verts: np.ndarray, ring_ends: list[int]) -> list:
 
     # First, we should know which rings are directly contained in it for each ring
 
-    right = [max(verts[rings[i], 0]) for i in range(len(rings))]
-    left = [min(verts[rings[i], 0]) for i in range(len(rings))]
-    top = [max(verts[rings[i], 1]) for i in range(len(rings))]
-    bottom = [min(verts[rings[i], 1]) for i in range(len(rings))]
-    area = [ring_area(i) for i in range(len(rings))]
+    right = np.maximum.reduceat(verts[:, 0], starts)
+    left = np.minimum.reduceat(verts[:, 0], starts)
+    top = np.maximum.reduceat(verts[:, 1], starts)
+    bottom = np.minimum.reduceat(verts[:, 1], starts)
+
+    # Cross products of consecutive vertices, where they belong to the
+    # same ring, summed in order along each ring
+    crosses = cross2d(verts[1:], verts[:-1])
+    area = np.array([
+        abs(np.cumsum(crosses[e0:e1 - 1])[-1]) / 2 if e1 - e0 > 1 else 0
+        for e0, e1 in zip(starts, ends)
+    ])
 
     # The larger ring must be outside
     rings_sorted = list(range(len(rings)))
     rings_sorted.sort(key=lambda x: area[x], reverse=True)
-
-    def is_in_fast(ring_a, ring_b):
-        # Whether a is in b
-        return reduce(op.and_, (
-            left[ring_b] <= left[ring_a] <= right[ring_a] <= right[ring_b],
-            bottom[ring_b] <= bottom[ring_a] <= top[ring_a] <= top[ring_b],
-            is_in(verts[rings[ring_a][0]], ring_b)
-        ))
+    rank = np.zeros(len(rings), dtype=int)
+    rank[rings_sorted] = range(len(rings))
+
+    # Rings sorted by their left edge, so that those which could contain a
+    # given ring's bounding box are found as a prefix of this order
+    by_left = np.argsort(left, kind="stable")
+    sorted_left = left[by_left]
+
+    def get_containing_candidates(ring_a):
+        # Larger rings whose bounding box contains that of ring_a,
+        # closest in area first
+        cands = by_left[:np.searchsorted(sorted_left, left[ring_a], side="right")]
+        cands = cands[
+            (rank[cands] < rank[ring_a])
+            & (right[ring_a] <= right[cands])
+            & (bottom[cands] <= bottom[ring_a])
+            & (top[ring_a] <= top[cands])
+        ]
+        return cands[np.argsort(-rank[cands])]
+
+    def get_winding_numbers(point, ring_ids):
+        # Same computation as get_winding_number, but for the point relative
+        # to several rings at once
+        lengths = ends[ring_ids] - starts[ring_ids]
+        offsets = np.repeat(starts[ring_ids] - np.cumsum([0, *lengths[:-1]]), lengths)
+        indices = np.arange(lengths.sum()) + offsets
+        diffs = verts[indices, :2] - point[:2]
+        angles = np.arctan2(diffs[:, 1], diffs[:, 0])
+        seg_starts = np.cumsum([0, *lengths[:-1]])
+        next_angles = np.roll(angles, -1)
+        next_angles[seg_starts + lengths - 1] = angles[seg_starts]
+        d_angles = ((next_angles - angles + PI) % TAU) - PI
+        return np.add.reduceat(d_angles, seg_starts) / TAU
 
     chilren = [[] for i in rings]
     ringenum = ProgressDisplay(
@@ -433,10 +471,13 @@ def earclip_triangulation(verts: np.ndarray, ring_ends: list[int]) -> list:
         delay=3,
     )
     for idx, i in ringenum:
-        for j in rings_sorted[:idx][::-1]:
-            if is_in_fast(i, j):
-                chilren[j].append(i)
-                break
+        cands = get_containing_candidates(i)
+        if len(cands) == 0:
+            continue
+        winding_numbers = get_winding_numbers(verts[rings[i][0]], cands)
+        is_in = np.abs(np.abs(winding_numbers) - 1) < 1e-5
+        if is_in.any():
+            chilren[cands[np.argmax(is_in)]].append(i)
 
     res = []
 
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+import glob
 import os
 import re
+import threading
 import yaml
 
 from manimlib.config import get_custom_config
@@ -51,9 +55,31 @@ def get_tex_config() -> dict[str, str]:
     return SAVED_TEX_CONFIG
 
 
-def tex_content_to_svg_file(
-    content: str, template: str, additional_preamble: str
-) -> str:
+# Expressions waiting to be compiled, as a map from the svg file each
+# should be written to onto its content, grouped by compiler and preamble
+PENDING_TEX: dict[tuple[str, str], dict[str, str]] = {}
+# Futures for svg files being compiled in the background, which
+# are dropped once they're done
+TEX_FUTURES: dict[str, Future] = {}
+# Compilation happens in latex and dvisvgm subprocesses, so threads
+# are enough to have several of them running at once.  Processes rendering
+# parts of one scene together each get a share of these.
+TEX_COMPILE_WORKERS = os.cpu_count() or 1
+TEX_COMPILE_POOL: list[ThreadPoolExecutor] = []
+
+
+def set_tex_compile_workers(n_workers: int) -> None:
+    """
+    Only affects compiles started after the pool is next created,
+    so it should be called before any tex is compiled
+    """
+    global TEX_COMPILE_WORKERS
+    TEX_COMPILE_WORKERS = max(int(n_workers), 1)
+
+
+def get_compiler_and_preamble(
+    template: str, additional_preamble: str
+) -> tuple[str, str]:
     tex_config = get_tex_config()
     if not template or template == tex_config["template"]:
         compiler = tex_config["compiler"]
@@ -65,7 +91,11 @@ def tex_content_to_svg_file(
 
     if additional_preamble:
         preamble += "\n" + additional_preamble
-    full_tex = "\n\n".join((
+    return compiler, preamble
+
+
+def get_full_tex(content: str, preamble: str) -> str:
+    return "\n\n".join((
         "\\documentclass[preview]{standalone}",
         preamble,
         "\\begin{document}",
@@ -73,75 +103,283 @@ def tex_content_to_svg_file(
         "\\end{document}"
     )) + "\n"
 
+
+def queue_tex_content(
+    content: str, template: str, additional_preamble: str
+) -> str:
+    """
+    Returns the path of the svg file for this content, adding it to those
+    waiting to be compiled if it doesn't exist yet.  Queueing up several
+    expressions before any are needed lets them be compiled together.
+    """
+    compiler, preamble = get_compiler_and_preamble(template, additional_preamble)
+    full_tex = get_full_tex(content, preamble)
     svg_file = os.path.join(
         get_tex_dir(), hash_string(full_tex) + ".svg"
     )
-    if not os.path.exists(svg_file):
-        # If svg doesn't exist, create it
-        create_tex_svg(full_tex, svg_file, compiler)
+    # Finished futures are dropped from another thread, so
+    # look this up only once
+    future = TEX_FUTURES.get(svg_file)
+    in_progress = future is not None and not future.done()
+    if not os.path.exists(svg_file) and not in_progress:
+        PENDING_TEX.setdefault((compiler, preamble), {})[svg_file] = content
     return svg_file
 
 
-def create_tex_svg(full_tex: str, svg_file: str, compiler: str) -> None:
+def get_tex_compile_pool() -> ThreadPoolExecutor:
+    if not TEX_COMPILE_POOL:
+        TEX_COMPILE_POOL.append(ThreadPoolExecutor(
+            max_workers=TEX_COMPILE_WORKERS,
+            thread_name_prefix="tex_compile",
+        ))
+    return TEX_COMPILE_POOL[0]
+
+
+def compile_pending_tex() -> dict[str, Future]:
+    """
+    Starts compiling everything pending in the background, with the
+    expressions for each compiler and preamble split into at most one
+    multi-page batch per worker.  Returns the futures for each svg file.
+    """
+    pool = get_tex_compile_pool()
+    all_futures = dict()
+    while PENDING_TEX:
+        (compiler, preamble), svg_file_to_content = PENDING_TEX.popitem()
+        items = list(svg_file_to_content.items())
+        n_batches = min(TEX_COMPILE_WORKERS, len(items))
+        for batch in (items[i::n_batches] for i in range(n_batches)):
+            futures = {svg_file: Future() for svg_file, _ in batch}
+            TEX_FUTURES.update(futures)
+            all_futures.update(futures)
+            pool.submit(
+                compile_tex_batch, dict(batch), compiler, preamble, futures
+            )
+    return all_futures
+
+
+def compile_tex_batch(
+    svg_file_to_content: dict[str, str],
+    compiler: str,
+    preamble: str,
+    futures: dict[str, Future]
+) -> None:
+    try:
+        create_tex_svgs(svg_file_to_content, compiler, preamble)
+    except Exception as err:
+        for svg_file, future in futures.items():
+            drop_tex_future(svg_file, future)
+            future.set_exception(err)
+        return
+    for svg_file, future in futures.items():
+        drop_tex_future(svg_file, future)
+        if os.path.exists(svg_file):
+            future.set_result(svg_file)
+        else:
+            # The error was logged when compiling
+            future.set_exception(LatexError())
+
+
+def drop_tex_future(svg_file: str, future: Future) -> None:
+    # Unless the same file has been queued again since
+    if TEX_FUTURES.get(svg_file) is future:
+        TEX_FUTURES.pop(svg_file, None)
+
+
+def request_tex_svg_file(
+    content: str, template: str, additional_preamble: str
+) -> Future:
+    """
+    Returns a future for the path of the svg file for this content, which
+    raises LatexError if it fails to compile.  Anything else pending
+    starts compiling alongside it.
+    """
+    svg_file = queue_tex_content(content, template, additional_preamble)
+    if os.path.exists(svg_file):
+        future = Future()
+        future.set_result(svg_file)
+        return future
+    future = compile_pending_tex().get(svg_file, TEX_FUTURES.get(svg_file))
+    if future is None:
+        # An earlier compile of it finished just now
+        return request_tex_svg_file(content, template, additional_preamble)
+    return future
+
+
+def tex_content_to_svg_file(
+    content: str, template: str, additional_preamble: str
+) -> str:
+    return request_tex_svg_file(content, template, additional_preamble).result()
+
+
+def get_temp_root(file_path: str) -> str:
+    # Unique to this thread and process, so that concurrent compiles
+    # of the same content don't trip over each other's files
+    root, _ = os.path.splitext(file_path)
+    return f"{root}_{os.getpid()}_{threading.get_ident()}"
+
+
+def create_tex_svgs(
+    svg_file_to_content: dict[str, str], compiler: str, preamble: str
+) -> None:
+    """
+    Compiles all the expressions as pages of a single document if there are
+    several, falling back to compiling them one by one if that fails, so
+    that one bad expression doesn't take the others down with it.
+    """
+    if len(svg_file_to_content) > 1:
+        try:
+            create_multipage_tex_svgs(svg_file_to_content, compiler, preamble)
+            return
+        except LatexError:
+            pass
+    for svg_file, content in svg_file_to_content.items():
+        if os.path.exists(svg_file):
+            continue
+        try:
+            create_tex_svg(get_full_tex(content, preamble), svg_file, compiler)
+        except LatexError:
+            pass
+
+
+def get_compiler_program(compiler: str) -> tuple[str, str]:
     if compiler == "latex":
-        program = "latex"
-        dvi_ext = ".dvi"
+        return "latex", ".dvi"
     elif compiler == "xelatex":
-        program = "xelatex -no-pdf"
-        dvi_ext = ".xdv"
+        return "xelatex -no-pdf", ".xdv"
     else:
         raise NotImplementedError(
             f"Compiler '{compiler}' is not implemented"
         )
 
+
+def compile_tex_to_dvi(full_tex: str, root: str, program: str) -> bool:
     # Write tex file
-    root, _ = os.path.splitext(svg_file)
     with open(root + ".tex", "w", encoding="utf-8") as tex_file:
         tex_file.write(full_tex)
 
     # tex to dvi
-    if os.system(" ".join((
+    return not os.system(" ".join((
         program,
         "-interaction=batchmode",
         "-halt-on-error",
-        f"-output-directory=\"{os.path.dirname(svg_file)}\"",
+        f"-output-directory=\"{os.path.dirname(root)}\"",
         f"\"{root}.tex\"",
         ">",
         os.devnull
-    ))):
-        log.error(
-            "LaTeX Error!  Not a worry, it happens to the best of us."
-        )
-        with open(root + ".log", "r", encoding="utf-8") as log_file:
-            error_match_obj = re.search(r"(?<=\n! ).*", log_file.read())
-            if error_match_obj:
-                log.debug(
-                    "The error could be: `%s`",
-                    error_match_obj.group()
-                )
-        raise LatexError()
-
-    # dvi to svg
-    os.system(" ".join((
+    )))
+
+
+def log_latex_error(root: str) -> None:
+    log.error(
+        "LaTeX Error!  Not a worry, it happens to the best of us."
+    )
+    with open(root + ".log", "r", encoding="utf-8") as log_file:
+        error_match_obj = re.search(r"(?<=\n! ).*", log_file.read())
+        if error_match_obj:
+            log.debug(
+                "The error could be: `%s`",
+                error_match_obj.group()
+            )
+
+
+def run_dvisvgm(root: str, dvi_ext: str, *options: str, log_error: bool = False) -> bool:
+    """
+    Converts root + dvi_ext to svg, returning whether that succeeded.
+    Otherwise the command and its output are logged, as an error if
+    log_error is set, and for debugging either way.
+    """
+    command = " ".join((
         "dvisvgm",
         f"\"{root}{dvi_ext}\"",
         "-n",
+        # Only error messages
         "-v",
-        "0",
-        "-o",
-        f"\"{svg_file}\"",
-        ">",
-        os.devnull
-    )))
+        "1",
+        *options,
+    ))
+    output_file = root + ".dvisvgm.log"
+    exit_code = os.system(f"{command} > \"{output_file}\" 2>&1")
+    svg_files = glob.glob(glob.escape(root) + "*.svg")
+    if exit_code == 0 and svg_files:
+        return True
+    if log_error:
+        log.error("dvisvgm Error!  Converting the compiled LaTeX to svg failed.")
+    log.debug("The failing command was: `%s`", command)
+    with open(output_file, "r", encoding="utf-8", errors="replace") as fp:
+        output = fp.read().strip()
+    if output:
+        log.debug("Its output was:\n%s", output)
+    return False
 
+
+def remove_tex_byproducts(root: str, dvi_ext: str) -> None:
     # Cleanup superfluous documents
-    for ext in (".tex", dvi_ext, ".log", ".aux"):
+    for ext in (".tex", dvi_ext, ".log", ".aux", ".dvisvgm.log"):
         try:
             os.remove(root + ext)
         except FileNotFoundError:
             pass
 
 
+def create_tex_svg(full_tex: str, svg_file: str, compiler: str) -> None:
+    program, dvi_ext = get_compiler_program(compiler)
+    root = get_temp_root(svg_file)
+    try:
+        if not compile_tex_to_dvi(full_tex, root, program):
+            log_latex_error(root)
+            raise LatexError()
+
+        # dvi to svg, which only appears under its final name once complete
+        if not run_dvisvgm(root, dvi_ext, "-o", f"\"{root}.svg\"", log_error=True):
+            raise LatexError()
+        os.replace(root + ".svg", svg_file)
+    finally:
+        remove_tex_byproducts(root, dvi_ext)
+
+
+def create_multipage_tex_svgs(
+    svg_file_to_content: dict[str, str], compiler: str, preamble: str
+) -> None:
+    """
+    Each expression goes on its own page of one standalone document, and
+    dvisvgm then writes each page to the svg file for that expression.
+    """
+    program, dvi_ext = get_compiler_program(compiler)
+    svg_files = list(svg_file_to_content.keys())
+    full_tex = "\n\n".join((
+        "\\documentclass[preview,multi=manimpage]{standalone}",
+        preamble,
+        "\\ifdefined\\manimpage\\else\\newenvironment{manimpage}{}{}\\fi",
+        "\\begin{document}",
+        *(
+            "\\begin{manimpage}\n" + content + "\n\\end{manimpage}"
+            for content in svg_file_to_content.values()
+        ),
+        "\\end{document}"
+    )) + "\n"
+    root = get_temp_root(os.path.join(get_tex_dir(), hash_string(full_tex)))
+    try:
+        if not compile_tex_to_dvi(full_tex, root, program):
+            raise LatexError()
+
+        # dvi to one svg per page
+        # Failures here fall back to compiling expressions one by one
+        converted = run_dvisvgm(root, dvi_ext, "-p", "1-", "-o", f"\"{root}-%p.svg\"")
+        # Page numbers may or may not be padded with zeros
+        page_files = sorted(
+            (int(re.search(r"-(\d+)\.svg$", file_path).group(1)), file_path)
+            for file_path in glob.glob(glob.escape(root) + "-*.svg")
+        )
+        if not converted or len(page_files) != len(svg_files):
+            for _, file_path in page_files:
+                os.remove(file_path)
+            raise LatexError()
+        for (_, page_file), svg_file in zip(page_files, svg_files):
+            os.replace(page_file, svg_file)
+    finally:
+        remove_tex_byproducts(root, dvi_ext)
+
+
 # TODO, perhaps this should live elsewhere
 @contextmanager
 def display_during_execution(message: str):